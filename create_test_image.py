@@ -3,17 +3,50 @@ Script pour créer une image disque FAT16 de test
 Utile pour tester l'application sans avoir à créer manuellement une image
 """
 
+import os
 import struct
 import sys
 
+# Boot sector : jump boot + OEM name + BPB (octets 0-35), puis EBPB (octets 36-61)
+_BPB = struct.Struct('<3s8sHBHBHHBHHHII')
+_EBPB = struct.Struct('<BBBI11s8s')
 
-def create_fat16_test_image(filename: str, size_mb: int = 10):
+# Entrée de répertoire (32 octets) : nom 8.3, attribut, [14 octets ignorés], premier cluster, taille
+_DIR_ENTRY = struct.Struct('<11sB14xHI')
+
+# Motifs de 256 octets (croissant / décroissant) pour les clusters de DATA.BIN
+_ASC256 = bytes(range(256))
+_DESC256 = bytes(range(255, -1, -1))
+
+
+def _allocate_dense(f, size_bytes: int):
+    """
+    Alloue tous les blocs du fichier sans écrire de zéros depuis Python
+
+    Args:
+        f: Fichier ouvert en écriture
+        size_bytes: Taille totale à allouer
+    """
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(f.fileno(), 0, size_bytes)
+            return
+        except OSError:
+            pass  # Système de fichiers sans support : on se rabat sur truncate
+
+    # Pas de posix_fallocate (Windows, macOS) : l'image reste creuse
+    f.truncate(size_bytes)
+
+
+def create_fat16_test_image(filename: str, size_mb: int = 10, dense: bool = False):
     """
     Crée une image disque FAT16 minimale pour les tests
 
     Args:
         filename: Nom du fichier à créer
         size_mb: Taille de l'image en MB (défaut: 10)
+        dense: Si True, tous les blocs de l'image sont alloués sur le disque
+               (posix_fallocate) au lieu de créer un fichier creux
     """
     # Paramètres FAT16
     bytes_per_sector = 512
@@ -45,36 +78,43 @@ def create_fat16_test_image(filename: str, size_mb: int = 10):
 
     # Créer le fichier
     with open(filename, 'wb') as f:
+        # 0. Image dense : le noyau réserve tous les blocs d'un coup,
+        #    seules les métadonnées et les clusters de test sont écrits ensuite
+        if dense:
+            _allocate_dense(f, total_sectors * bytes_per_sector)
+
         # 1. Boot Sector (secteur 0)
         boot_sector = bytearray(512)
 
-        # Jump boot (3 octets)
-        boot_sector[0:3] = bytes([0xEB, 0x3C, 0x90])
-
-        # OEM Name (8 octets)
-        boot_sector[3:11] = b'TESTFAT '
-
-        # BPB (BIOS Parameter Block)
-        struct.pack_into('<H', boot_sector, 11, bytes_per_sector)      # Octets par secteur
-        struct.pack_into('B', boot_sector, 13, sectors_per_cluster)     # Secteurs par cluster
-        struct.pack_into('<H', boot_sector, 14, reserved_sectors)       # Secteurs réservés
-        struct.pack_into('B', boot_sector, 16, num_fats)                # Nombre de FATs
-        struct.pack_into('<H', boot_sector, 17, root_entries)           # Entrées root
-        struct.pack_into('<H', boot_sector, 19, 0)                      # Total secteurs 16-bit (0 si > 65535)
-        struct.pack_into('B', boot_sector, 21, media_descriptor)        # Media descriptor
-        struct.pack_into('<H', boot_sector, 22, sectors_per_fat)        # Secteurs par FAT
-        struct.pack_into('<H', boot_sector, 24, sectors_per_track)      # Secteurs par piste
-        struct.pack_into('<H', boot_sector, 26, num_heads)              # Nombre de têtes
-        struct.pack_into('<I', boot_sector, 28, hidden_sectors)         # Secteurs cachés
-        struct.pack_into('<I', boot_sector, 32, total_sectors)          # Total secteurs 32-bit
-
-        # EBPB (Extended BIOS Parameter Block)
-        struct.pack_into('B', boot_sector, 36, 0x80)                    # Drive number
-        struct.pack_into('B', boot_sector, 37, 0)                       # Reserved
-        struct.pack_into('B', boot_sector, 38, 0x29)                    # Boot signature
-        struct.pack_into('<I', boot_sector, 39, 0x12345678)             # Volume ID
-        boot_sector[43:54] = b'TEST IMAGE '                             # Volume label
-        boot_sector[54:62] = b'FAT16   '                                # File system type
+        # Jump boot, OEM Name et BPB (BIOS Parameter Block), octets 0-35
+        _BPB.pack_into(
+            boot_sector, 0,
+            b'\xEB\x3C\x90',        # Jump boot (3 octets)
+            b'TESTFAT ',            # OEM Name (8 octets)
+            bytes_per_sector,       # Octets par secteur
+            sectors_per_cluster,    # Secteurs par cluster
+            reserved_sectors,       # Secteurs réservés
+            num_fats,               # Nombre de FATs
+            root_entries,           # Entrées root
+            0,                      # Total secteurs 16-bit (0 si > 65535)
+            media_descriptor,       # Media descriptor
+            sectors_per_fat,        # Secteurs par FAT
+            sectors_per_track,      # Secteurs par piste
+            num_heads,              # Nombre de têtes
+            hidden_sectors,         # Secteurs cachés
+            total_sectors,          # Total secteurs 32-bit
+        )
+
+        # EBPB (Extended BIOS Parameter Block), octets 36-61
+        _EBPB.pack_into(
+            boot_sector, 36,
+            0x80,                   # Drive number
+            0,                      # Reserved
+            0x29,                   # Boot signature
+            0x12345678,             # Volume ID
+            b'TEST IMAGE ',         # Volume label
+            b'FAT16   ',            # File system type
+        )
 
         # Boot signature (2 derniers octets)
         struct.pack_into('<H', boot_sector, 510, 0xAA55)
@@ -82,28 +122,21 @@ def create_fat16_test_image(filename: str, size_mb: int = 10):
         # Écrire le boot sector
         f.write(boot_sector)
 
-        # 2. Secteurs réservés (secteurs 1-3)
-        for i in range(1, reserved_sectors):
-            f.write(bytes(bytes_per_sector))
+        # 2. Secteurs réservés (secteurs 1-3) : laissés à zéro, on saute directement à la FAT
+        f.seek(reserved_sectors * bytes_per_sector)
 
         # 3. FAT 1
         fat = bytearray(sectors_per_fat * bytes_per_sector)
-        # Les deux premières entrées sont réservées
-        struct.pack_into('<H', fat, 0, 0xFFF8)  # Media descriptor
-        struct.pack_into('<H', fat, 2, 0xFFFF)  # End of chain marker
-
-        # Créer quelques chaînes de test
-        # Chaîne 1: clusters 2 -> 3 -> 4 -> EOF
-        struct.pack_into('<H', fat, 2 * 2, 3)      # Cluster 2 -> 3
-        struct.pack_into('<H', fat, 3 * 2, 4)      # Cluster 3 -> 4
-        struct.pack_into('<H', fat, 4 * 2, 0xFFFF) # Cluster 4 -> EOF
-
-        # Chaîne 2: clusters 5 -> 6 -> EOF
-        struct.pack_into('<H', fat, 5 * 2, 6)      # Cluster 5 -> 6
-        struct.pack_into('<H', fat, 6 * 2, 0xFFFF) # Cluster 6 -> EOF
-
-        # Chaîne cassée : cluster 7 -> 0x0000 (cassé)
-        struct.pack_into('<H', fat, 7 * 2, 0x0000) # Cluster 7 cassé
+        # Entrées 0 à 7 écrites en un seul appel :
+        #   0, 1 : réservées (media descriptor, end of chain marker)
+        #   Chaîne 1 : clusters 2 -> 3 -> 4 -> EOF
+        #   Chaîne 2 : clusters 5 -> 6 -> EOF
+        #   Chaîne cassée : cluster 7 -> 0x0000 (cassé)
+        struct.pack_into('<8H', fat, 0,
+                         0xFFF8, 0xFFFF,
+                         3, 4, 0xFFFF,
+                         6, 0xFFFF,
+                         0x0000)
 
         f.write(fat)
 
@@ -114,35 +147,18 @@ def create_fat16_test_image(filename: str, size_mb: int = 10):
         root_dir_sectors = ((root_entries * 32) + (bytes_per_sector - 1)) // bytes_per_sector
         root_dir = bytearray(root_dir_sectors * bytes_per_sector)
 
-        # Créer quelques entrées de test
-        # Entrée 1: TEST.TXT
-        entry_offset = 0
-        root_dir[entry_offset:entry_offset + 11] = b'TEST    TXT'
-        root_dir[entry_offset + 11] = 0x20  # Attribut: archive
-        struct.pack_into('<H', root_dir, entry_offset + 26, 2)  # Premier cluster: 2
-        struct.pack_into('<I', root_dir, entry_offset + 28, 1024)  # Taille: 1024 octets
-
-        # Entrée 2: DATA.BIN
-        entry_offset = 32
-        root_dir[entry_offset:entry_offset + 11] = b'DATA    BIN'
-        root_dir[entry_offset + 11] = 0x20  # Attribut: archive
-        struct.pack_into('<H', root_dir, entry_offset + 26, 5)  # Premier cluster: 5
-        struct.pack_into('<I', root_dir, entry_offset + 28, 2048)  # Taille: 2048 octets
-
-        # Entrée 3: BROKEN.DAT (pointant vers cluster cassé)
-        entry_offset = 64
-        root_dir[entry_offset:entry_offset + 11] = b'BROKEN  DAT'
-        root_dir[entry_offset + 11] = 0x20  # Attribut: archive
-        struct.pack_into('<H', root_dir, entry_offset + 26, 7)  # Premier cluster: 7 (cassé)
-        struct.pack_into('<I', root_dir, entry_offset + 28, 512)  # Taille: 512 octets
+        # Créer quelques entrées de test (nom, attribut, premier cluster, taille)
+        test_entries = [
+            (b'TEST    TXT', 0x20, 2, 1024),  # Entrée 1: TEST.TXT
+            (b'DATA    BIN', 0x20, 5, 2048),  # Entrée 2: DATA.BIN
+            (b'BROKEN  DAT', 0x20, 7, 512),   # Entrée 3: BROKEN.DAT (pointant vers cluster cassé)
+        ]
+        for i, entry in enumerate(test_entries):
+            _DIR_ENTRY.pack_into(root_dir, i * 32, *entry)
 
         f.write(root_dir)
 
         # 6. Zone de données
-        # Calculer le nombre de secteurs de données
-        first_data_sector = reserved_sectors + (num_fats * sectors_per_fat) + root_dir_sectors
-        data_sectors = total_sectors - first_data_sector
-
         # Écrire des données de test dans les premiers clusters
         cluster_size = sectors_per_cluster * bytes_per_sector
 
@@ -162,21 +178,20 @@ def create_fat16_test_image(filename: str, size_mb: int = 10):
         f.write(cluster_4)
 
         # Cluster 5 (DATA.BIN)
-        cluster_5 = bytes(range(256)) * (cluster_size // 256)
+        cluster_5 = _ASC256 * (cluster_size // 256)
         f.write(cluster_5)
 
         # Cluster 6 (suite de DATA.BIN)
-        cluster_6 = bytes(range(255, -1, -1)) * (cluster_size // 256)
+        cluster_6 = _DESC256 * (cluster_size // 256)
         f.write(cluster_6)
 
         # Cluster 7 (BROKEN.DAT - données corrompues)
         cluster_7 = b'\xDE\xAD\xBE\xEF' * (cluster_size // 4)
         f.write(cluster_7)
 
-        # Remplir le reste avec des zéros
-        remaining_clusters = (data_sectors - 7 * sectors_per_cluster) // sectors_per_cluster
-        for i in range(remaining_clusters):
-            f.write(bytes(cluster_size))
+        # Remplir le reste avec des zéros : un seul truncate étend le fichier
+        # (fichier creux sur les systèmes de fichiers qui le supportent)
+        f.truncate(total_sectors * bytes_per_sector)
 
     print(f"✓ Image créée: {filename}")
     print(f"\nFichiers de test créés dans l'image:")
@@ -187,14 +202,18 @@ def create_fat16_test_image(filename: str, size_mb: int = 10):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        filename = sys.argv[1]
+    # Option --dense : image entièrement allouée (utile pour des mesures d'I/O reproductibles)
+    dense = "--dense" in sys.argv
+    args = [arg for arg in sys.argv[1:] if arg != "--dense"]
+
+    if len(args) > 0:
+        filename = args[0]
     else:
         filename = "test_fat16.raw"
 
-    if len(sys.argv) > 2:
-        size_mb = int(sys.argv[2])
+    if len(args) > 1:
+        size_mb = int(args[1])
     else:
         size_mb = 10
 
-    create_fat16_test_image(filename, size_mb)
+    create_fat16_test_image(filename, size_mb, dense)
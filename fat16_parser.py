@@ -3,14 +3,74 @@ Parser for FAT16 disk images (.raw)
 Reads and analyzes the structure of a FAT16 partition
 """
 
+import logging
+import mmap
+import os
 import struct
-from typing import Optional, Dict, List, Tuple
+import sys
+from array import array
+from typing import Optional, Dict, List, Tuple, Iterable, Sequence
 from dataclasses import dataclass
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# On-disk layouts, compiled once
+_BPB = struct.Struct('<HBHBHHBHHHII')    # BIOS Parameter Block, offsets 11-35
+_EBPB = struct.Struct('<B2xI11s8s')      # Extended BPB (FAT12/16), offsets 36-61
+_MBR_ENTRY = struct.Struct('<B3sB3sII')  # MBR partition entry, 16 bytes
+
+# array typecode holding exactly 32 bits ('L' is 64-bit on some platforms)
+_UINT32 = 'I' if array('I').itemsize == 4 else 'L'
+
+# (EOF threshold, bad cluster marker) for each FAT type
+_FAT_MARKERS = {
+    'FAT12': (0xFF8, 0xFF7),
+    'FAT16': (0xFFF8, 0xFFF7),
+    'FAT32': (0x0FFFFFF8, 0x0FFFFFF7),
+}
+
+
+def _decode_fat12(fat_data: bytes) -> array:
+    """Unpacks a FAT12 table (two 12-bit entries per 3 bytes) into 16-bit integers"""
+    entries = array('H')
+    append = entries.append
+
+    # Byte k of each 3-byte group, taken with C-level slices
+    for low, middle, high in zip(fat_data[0::3], fat_data[1::3], fat_data[2::3]):
+        append(low | ((middle & 0x0F) << 8))   # Even cluster: bits 0-11
+        append((middle >> 4) | (high << 4))    # Odd cluster: bits 12-23
+
+    # Two trailing bytes still hold a complete even entry
+    if len(fat_data) % 3 == 2:
+        append(fat_data[-2] | ((fat_data[-1] & 0x0F) << 8))
+
+    return entries
+
+
+def set_debug(enabled: bool):
+    """Enables or disables the parser debug messages (write/reopen traces)"""
+    if enabled and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('[FAT16Parser] %(message)s'))
+        logger.addHandler(handler)
+    logger.setLevel(logging.DEBUG if enabled else logging.NOTSET)
+
+
+@dataclass(frozen=True)
 class BootSector:
-    """Represents the FAT16 Boot Sector"""
+    """Represents the FAT16 Boot Sector (immutable once parsed)"""
+    # Slots keep attribute access cheap; the derived geometry is computed once
+    # in __post_init__ and stored alongside the raw BPB fields
+    __slots__ = (
+        'bytes_per_sector', 'sectors_per_cluster', 'reserved_sectors', 'num_fats',
+        'root_entries', 'total_sectors_16', 'media_descriptor', 'sectors_per_fat',
+        'sectors_per_track', 'num_heads', 'hidden_sectors', 'total_sectors_32',
+        'drive_number', 'volume_id', 'raw_volume_label', 'raw_fs_type',
+        'total_sectors', 'root_dir_sectors', 'first_data_sector', 'data_sectors',
+        'total_clusters',
+    )
+
     bytes_per_sector: int
     sectors_per_cluster: int
     reserved_sectors: int
@@ -25,38 +85,48 @@ class BootSector:
     total_sectors_32: int
     drive_number: int
     volume_id: int
-    volume_label: str
-    fs_type: str
+    raw_volume_label: bytes  # Padded ASCII, decoded on access (volume_label)
+    raw_fs_type: bytes       # Padded ASCII, decoded on access (fs_type)
+
+    def __post_init__(self):
+        """Precomputes the derived geometry of the partition"""
+        # Total number of sectors
+        total_sectors = self.total_sectors_32 if self.total_sectors_32 > 0 else self.total_sectors_16
+        # Number of root directory sectors
+        root_dir_sectors = ((self.root_entries * 32) + (self.bytes_per_sector - 1)) // self.bytes_per_sector
+        # First sector of the data area
+        first_data_sector = self.reserved_sectors + (self.num_fats * self.sectors_per_fat) + root_dir_sectors
+        # Number of data sectors
+        data_sectors = total_sectors - first_data_sector
+
+        object.__setattr__(self, 'total_sectors', total_sectors)
+        object.__setattr__(self, 'root_dir_sectors', root_dir_sectors)
+        object.__setattr__(self, 'first_data_sector', first_data_sector)
+        object.__setattr__(self, 'data_sectors', data_sectors)
+        # Total number of clusters
+        object.__setattr__(self, 'total_clusters', data_sectors // self.sectors_per_cluster)
 
     @property
-    def total_sectors(self) -> int:
-        """Returns the total number of sectors"""
-        return self.total_sectors_32 if self.total_sectors_32 > 0 else self.total_sectors_16
+    def volume_label(self) -> str:
+        """Volume label, decoded only when needed"""
+        return self.raw_volume_label.decode('ascii', errors='ignore').strip()
 
     @property
-    def root_dir_sectors(self) -> int:
-        """Calculates the number of root directory sectors"""
-        return ((self.root_entries * 32) + (self.bytes_per_sector - 1)) // self.bytes_per_sector
+    def fs_type(self) -> str:
+        """File system type string, decoded only when needed"""
+        return self.raw_fs_type.decode('ascii', errors='ignore').strip()
 
-    @property
-    def first_data_sector(self) -> int:
-        """Calculates the first sector of the data area"""
-        return self.reserved_sectors + (self.num_fats * self.sectors_per_fat) + self.root_dir_sectors
 
-    @property
-    def data_sectors(self) -> int:
-        """Calculates the number of data sectors"""
-        return self.total_sectors - self.first_data_sector
-
-    @property
-    def total_clusters(self) -> int:
-        """Calculates the total number of clusters"""
-        return self.data_sectors // self.sectors_per_cluster
+# MBR partition type codes, by FAT variant
+_FAT16_PARTITION_TYPES = frozenset({0x04, 0x06, 0x0E})
+_FAT32_PARTITION_TYPES = frozenset({0x0B, 0x0C})
 
 
-@dataclass
+@dataclass(frozen=True)
 class MBRPartition:
-    """Represents a partition entry in the MBR"""
+    """Represents a partition entry in the MBR (immutable once parsed)"""
+    __slots__ = ('status', 'start_chs', 'partition_type', 'end_chs', 'start_lba', 'total_sectors')
+
     status: int
     start_chs: Tuple[int, int, int]
     partition_type: int
@@ -67,12 +137,12 @@ class MBRPartition:
     def is_fat16(self) -> bool:
         """Checks if this is a FAT16 partition"""
         # FAT16 types: 0x04, 0x06, 0x0E
-        return self.partition_type in [0x04, 0x06, 0x0E]
+        return self.partition_type in _FAT16_PARTITION_TYPES
 
     def is_fat32(self) -> bool:
         """Checks if this is a FAT32 partition"""
         # FAT32 types: 0x0B, 0x0C
-        return self.partition_type in [0x0B, 0x0C]
+        return self.partition_type in _FAT32_PARTITION_TYPES
 
     def is_fat12(self) -> bool:
         """Checks if this is a FAT12 partition"""
@@ -86,20 +156,89 @@ class FAT16Parser:
     def __init__(self, image_path: str):
         self.image_path = image_path
         self.file_handle: Optional[object] = None
+        self._fd: Optional[int] = None  # OS-level descriptor of file_handle, used for positional reads
+        self._mm: Optional[mmap.mmap] = None  # Read-only mapping of the image (None if it cannot be mapped)
         self.boot_sector: Optional[BootSector] = None
         self.partitions: List[MBRPartition] = []
         self.current_partition_offset: int = 0
         self.fat_type: Optional[str] = None  # 'FAT12', 'FAT16', or 'FAT32'
 
+        # Layout offsets (in bytes, relative to the partition start),
+        # computed once when the boot sector is read
+        self._fat1_offset: int = 0
+        self._fat_size_bytes: int = 0
+        self._data_zone_offset: int = 0
+        self._cluster_bytes: int = 0
+
+        # get_info_dict() result, built on first call for the current boot sector
+        self._info: Optional[Dict] = None
+
+        # Reverse FAT map used by find_chain_start, tied to the FAT it was built from
+        self._pred_source: Optional[bytes] = None
+        self._pred_map: Dict[int, int] = {}
+
+        # FAT decoded as an integer array, tied to the FAT and the FAT type it was built for
+        self._entries_source: Optional[bytes] = None
+        self._entries_type: Optional[str] = None
+        self._entries: array = array('H')
+
+        # Chains already walked by parse_all_chains, by start cluster, tied to the FAT they were walked in
+        self._chains_source: Optional[bytes] = None
+        self._chains: Dict[int, List[int]] = {}
+
+        # read_fat() results by FAT number, dropped when a write touches the FAT region
+        self._fat_cache: Dict[int, bytes] = {}
+
     def open(self):
         """Opens the image file"""
-        self.file_handle = open(self.image_path, 'rb')
+        # Unbuffered: reads are large and positional, a Python-side buffer only adds a copy
+        self.file_handle = open(self.image_path, 'rb', buffering=0)
+        self._attach_handle()
+
+    def _attach_handle(self):
+        """Caches the descriptor of file_handle and maps the image in memory"""
+        self._fd = self.file_handle.fileno()
+        # FAT and directory reads walk the file forward: let the kernel read ahead
+        self._advise(0, 0, 'POSIX_FADV_SEQUENTIAL')
+        try:
+            # Writes go through file_handle; the shared mapping sees them through the page cache
+            self._mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty file or non-mappable device: fall back to positional reads
+            self._mm = None
+
+    def _advise(self, offset: int, length: int, advice: str):
+        """Passes an access pattern hint to the kernel (no-op where posix_fadvise is unavailable)"""
+        advice_value = getattr(os, advice, None)
+        if advice_value is None or not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            os.posix_fadvise(self._fd, offset, length, advice_value)
+        except OSError:
+            pass  # Only a hint
 
     def close(self):
         """Closes the image file"""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
         if self.file_handle:
             self.file_handle.close()
             self.file_handle = None
+            self._fd = None
+
+    def _pread(self, size: int, offset: int) -> bytes:
+        """Reads size bytes at an absolute offset without moving the file position"""
+        if self._mm is not None:
+            # Plain memory copy from the mapping, no syscall
+            return self._mm[offset:offset + size]
+
+        if hasattr(os, 'pread'):
+            return os.pread(self._fd, size, offset)
+
+        # No pread (Windows): fall back to seek + read
+        self.file_handle.seek(offset)
+        return self.file_handle.read(size)
 
     def __enter__(self):
         self.open()
@@ -113,34 +252,26 @@ class FAT16Parser:
         if not self.file_handle:
             raise RuntimeError("Image file not opened")
 
-        self.file_handle.seek(0)
-        mbr_data = self.file_handle.read(512)
+        mbr_data = self._pread(512, 0)
 
         # Check MBR signature (0x55AA at offset 510)
-        signature = struct.unpack('<H', mbr_data[510:512])[0]
+        signature = int.from_bytes(mbr_data[510:512], 'little')
         if signature != 0xAA55:
             raise ValueError("Invalid MBR signature")
 
         # Read the 4 partition entries (offset 446, 16 bytes each)
         partitions = []
         for i in range(4):
-            offset = 446 + (i * 16)
-            entry = mbr_data[offset:offset + 16]
-
-            status = entry[0]
-            start_chs = (entry[1], entry[2], entry[3])
-            partition_type = entry[4]
-            end_chs = (entry[5], entry[6], entry[7])
-            start_lba = struct.unpack('<I', entry[8:12])[0]
-            total_sectors = struct.unpack('<I', entry[12:16])[0]
+            status, start_chs, partition_type, end_chs, start_lba, total_sectors = \
+                _MBR_ENTRY.unpack_from(mbr_data, 446 + (i * 16))
 
             # Ignore empty partitions
             if partition_type != 0:
                 partition = MBRPartition(
                     status=status,
-                    start_chs=start_chs,
+                    start_chs=tuple(start_chs),
                     partition_type=partition_type,
-                    end_chs=end_chs,
+                    end_chs=tuple(end_chs),
                     start_lba=start_lba,
                     total_sectors=total_sectors
                 )
@@ -155,32 +286,19 @@ class FAT16Parser:
             raise RuntimeError("Image file not opened")
 
         self.current_partition_offset = partition_offset
-        self.file_handle.seek(partition_offset)
-        boot_data = self.file_handle.read(512)
+        boot_data = self._pread(512, partition_offset)
 
         # Check jump boot (0xEB or 0xE9 in first byte)
         if boot_data[0] not in [0xEB, 0xE9]:
             raise ValueError("Invalid jump boot - this may not be a FAT boot sector")
 
         # Parse the BPB (BIOS Parameter Block)
-        bytes_per_sector = struct.unpack('<H', boot_data[11:13])[0]
-        sectors_per_cluster = boot_data[13]
-        reserved_sectors = struct.unpack('<H', boot_data[14:16])[0]
-        num_fats = boot_data[16]
-        root_entries = struct.unpack('<H', boot_data[17:19])[0]
-        total_sectors_16 = struct.unpack('<H', boot_data[19:21])[0]
-        media_descriptor = boot_data[21]
-        sectors_per_fat = struct.unpack('<H', boot_data[22:24])[0]
-        sectors_per_track = struct.unpack('<H', boot_data[24:26])[0]
-        num_heads = struct.unpack('<H', boot_data[26:28])[0]
-        hidden_sectors = struct.unpack('<I', boot_data[28:32])[0]
-        total_sectors_32 = struct.unpack('<I', boot_data[32:36])[0]
+        (bytes_per_sector, sectors_per_cluster, reserved_sectors, num_fats,
+         root_entries, total_sectors_16, media_descriptor, sectors_per_fat,
+         sectors_per_track, num_heads, hidden_sectors, total_sectors_32) = _BPB.unpack_from(boot_data, 11)
 
         # EBPB (Extended BIOS Parameter Block) for FAT16
-        drive_number = boot_data[36]
-        volume_id = struct.unpack('<I', boot_data[39:43])[0]
-        volume_label = boot_data[43:54].decode('ascii', errors='ignore').strip()
-        fs_type = boot_data[54:62].decode('ascii', errors='ignore').strip()
+        drive_number, volume_id, raw_volume_label, raw_fs_type = _EBPB.unpack_from(boot_data, 36)
 
         self.boot_sector = BootSector(
             bytes_per_sector=bytes_per_sector,
@@ -197,13 +315,22 @@ class FAT16Parser:
             total_sectors_32=total_sectors_32,
             drive_number=drive_number,
             volume_id=volume_id,
-            volume_label=volume_label,
-            fs_type=fs_type
+            raw_volume_label=raw_volume_label,
+            raw_fs_type=raw_fs_type
         )
 
         # Automatically detect FAT type
         self._detect_fat_type()
 
+        # Precompute the layout offsets used by the offset helpers
+        bs = self.boot_sector
+        self._fat1_offset = bs.reserved_sectors * bs.bytes_per_sector
+        self._fat_size_bytes = bs.sectors_per_fat * bs.bytes_per_sector
+        self._data_zone_offset = bs.first_data_sector * bs.bytes_per_sector
+        self._cluster_bytes = bs.sectors_per_cluster * bs.bytes_per_sector
+        self._info = None
+        self._invalidate_fat_cache()
+
         return self.boot_sector
 
     def _detect_fat_type(self):
@@ -218,20 +345,125 @@ class FAT16Parser:
         # FAT16: 4085 - 65524 clusters
         # FAT32: >= 65525 clusters
         if total_clusters < 4085:
-            self.fat_type = 'FAT12'
+            self._set_fat_type('FAT12')
         elif total_clusters < 65525:
-            self.fat_type = 'FAT16'
+            self._set_fat_type('FAT16')
         else:
-            self.fat_type = 'FAT32'
+            self._set_fat_type('FAT32')
+
+    def _set_fat_type(self, fat_type: str):
+        """Sets the FAT type and binds the type-specific entry accessors once"""
+        if fat_type != self.fat_type:
+            # Chains and predecessors decoded under another FAT type are meaningless
+            self._invalidate_fat_cache()
+        self.fat_type = fat_type
+
+        # The instance attribute shadows the generic method, which branches on fat_type at every call
+        self.get_fat_entry = {
+            'FAT12': self._get_fat12_entry,
+            'FAT16': self._get_fat16_entry,
+            'FAT32': self._get_fat32_entry,
+        }[fat_type]
+
+    def get_cluster_offset(self, cluster_number: int) -> int:
+        """Returns the byte offset of a data cluster (relative to the partition start)"""
+        if not self.boot_sector:
+            raise RuntimeError("Boot sector not initialized")
+
+        if cluster_number < 2:
+            raise ValueError("Data clusters start at 2")
+
+        return self._data_zone_offset + (cluster_number - 2) * self._cluster_bytes
+
+    def get_fat_entry_offset(self, cluster_number: int, fat_number: int = 1) -> int:
+        """Returns the byte offset of a FAT entry (relative to the partition start)"""
+        if not self.boot_sector:
+            raise RuntimeError("Boot sector not initialized")
+
+        if fat_number not in [1, 2]:
+            raise ValueError("fat_number must be 1 or 2")
+
+        if self.fat_type == 'FAT12':
+            # 1.5 bytes per entry, computed with integer shift-add
+            entry_offset = cluster_number + (cluster_number >> 1)
+        elif self.fat_type == 'FAT32':
+            entry_offset = cluster_number * 4
+        else:
+            entry_offset = cluster_number * 2
+
+        return self._fat1_offset + (fat_number - 1) * self._fat_size_bytes + entry_offset
+
+    def get_cluster_offsets(self, cluster_numbers: Iterable[int]) -> Sequence[int]:
+        """
+        Returns the byte offsets of several data clusters in one pass
+
+        A range of clusters (e.g. a whole-volume scan) yields a range of offsets,
+        computed in O(1) without building a list.
+        """
+        if not self.boot_sector:
+            raise RuntimeError("Boot sector not initialized")
+
+        # offset = data_zone + (cluster - 2) * step, folded into a single base
+        step = self._cluster_bytes
+        base = self._data_zone_offset - 2 * step
+
+        if isinstance(cluster_numbers, range):
+            if cluster_numbers and min(cluster_numbers[0], cluster_numbers[-1]) < 2:
+                raise ValueError("Data clusters start at 2")
+            return range(base + cluster_numbers.start * step,
+                         base + cluster_numbers.stop * step,
+                         cluster_numbers.step * step)
+
+        clusters = list(cluster_numbers)
+        if clusters and min(clusters) < 2:
+            raise ValueError("Data clusters start at 2")
+
+        return [base + cluster * step for cluster in clusters]
+
+    def get_fat_entry_offsets(self, cluster_numbers: Iterable[int], fat_number: int = 1) -> Sequence[int]:
+        """
+        Returns the byte offsets of several FAT entries in one pass
+
+        For FAT16/32, a range of clusters yields a range of offsets (FAT12 entries
+        are 1.5 bytes wide and always produce a list).
+        """
+        if not self.boot_sector:
+            raise RuntimeError("Boot sector not initialized")
+
+        if fat_number not in [1, 2]:
+            raise ValueError("fat_number must be 1 or 2")
+
+        fat_start = self._fat1_offset + (fat_number - 1) * self._fat_size_bytes
+        entry_size = 4 if self.fat_type == 'FAT32' else 2
+
+        if isinstance(cluster_numbers, range) and self.fat_type != 'FAT12':
+            if cluster_numbers and min(cluster_numbers[0], cluster_numbers[-1]) < 0:
+                raise ValueError("Cluster numbers cannot be negative")
+            return range(fat_start + cluster_numbers.start * entry_size,
+                         fat_start + cluster_numbers.stop * entry_size,
+                         cluster_numbers.step * entry_size)
+
+        clusters = list(cluster_numbers)
+        if clusters and min(clusters) < 0:
+            raise ValueError("Cluster numbers cannot be negative")
+
+        # Branch on the FAT type once for the whole batch
+        if self.fat_type == 'FAT12':
+            return [fat_start + cluster + (cluster >> 1) for cluster in clusters]
+        return [fat_start + cluster * entry_size for cluster in clusters]
 
     def read_sector(self, sector_number: int) -> bytes:
         """Reads a specific sector"""
+        return self.read_sectors(sector_number, 1)
+
+    def read_sectors(self, first_sector: int, count: int) -> bytes:
+        """Reads count contiguous sectors with a single read"""
         if not self.file_handle or not self.boot_sector:
             raise RuntimeError("Image file or boot sector not initialized")
 
-        offset = self.current_partition_offset + (sector_number * self.boot_sector.bytes_per_sector)
-        self.file_handle.seek(offset)
-        return self.file_handle.read(self.boot_sector.bytes_per_sector)
+        bytes_per_sector = self.boot_sector.bytes_per_sector
+        offset = self.current_partition_offset + (first_sector * bytes_per_sector)
+        return self._pread(count * bytes_per_sector, offset)
 
     def read_cluster(self, cluster_number: int) -> bytes:
         """Reads a specific cluster (cluster 2 = first data cluster)"""
@@ -244,12 +476,67 @@ class FAT16Parser:
         # Calculate the corresponding sector
         first_sector = self.boot_sector.first_data_sector + ((cluster_number - 2) * self.boot_sector.sectors_per_cluster)
 
-        # Read all sectors in the cluster
-        data = b''
-        for i in range(self.boot_sector.sectors_per_cluster):
-            data += self.read_sector(first_sector + i)
+        # The sectors of a cluster are contiguous: read them all at once
+        return self.read_sectors(first_sector, self.boot_sector.sectors_per_cluster)
+
+    def read_chain_bytes(self, cluster_list: Sequence[int]) -> bytes:
+        """
+        Reads the data of a cluster chain, in chain order.
+
+        Runs of consecutive clusters are contiguous on disk and are read with a
+        single read each, so an unfragmented file costs one read whatever its length.
+
+        Args:
+            cluster_list: Clusters of the chain (as returned by parse_fat_chain)
 
-        return data
+        Returns:
+            The concatenated cluster data
+        """
+        return b''.join(self._read_cluster_runs(cluster_list))
+
+    def read_clusters_batch(self, cluster_numbers: Sequence[int]) -> List[bytes]:
+        """
+        Reads several clusters at once (same result as read_cluster for each of them).
+
+        Args:
+            cluster_numbers: Clusters to read, in any order
+
+        Returns:
+            The data of each cluster, in the order of cluster_numbers
+        """
+        cluster_bytes = self._cluster_bytes
+        clusters = []
+        for run_data in self._read_cluster_runs(cluster_numbers):
+            clusters.extend(run_data[offset:offset + cluster_bytes]
+                            for offset in range(0, len(run_data), cluster_bytes))
+        return clusters
+
+    def _read_cluster_runs(self, cluster_list: Sequence[int]) -> List[bytes]:
+        """Reads each run of consecutive clusters of cluster_list with a single read"""
+        if not self.file_handle or not self.boot_sector:
+            raise RuntimeError("Image file or boot sector not initialized")
+
+        if not cluster_list:
+            return []
+
+        if min(cluster_list) < 2:
+            raise ValueError("Data clusters start at 2")
+
+        # Loop invariants bound to locals (absolute offset of cluster 0 in the file)
+        pread = self._pread
+        cluster_bytes = self._cluster_bytes
+        base = self.current_partition_offset + self._data_zone_offset - 2 * cluster_bytes
+
+        runs = []
+        run_start = previous = cluster_list[0]
+        for cluster in cluster_list[1:]:
+            if cluster != previous + 1:
+                runs.append(pread((previous - run_start + 1) * cluster_bytes, base + run_start * cluster_bytes))
+                run_start = cluster
+            previous = cluster
+        runs.append(pread((previous - run_start + 1) * cluster_bytes, base + run_start * cluster_bytes))
+
+        return runs
 
     def read_fat(self, fat_number: int = 1) -> bytes:
         """Reads a complete FAT table (1 or 2)"""
@@ -265,13 +552,27 @@ class FAT16Parser:
         else:
             first_sector = self.boot_sector.reserved_sectors + self.boot_sector.sectors_per_fat
 
-        # Read all sectors of the FAT
-        fat_data = b''
-        for i in range(self.boot_sector.sectors_per_fat):
-            fat_data += self.read_sector(first_sector + i)
-
+        # Read the whole FAT at once, and only once until it is written to
+        fat_data = self._fat_cache.get(fat_number)
+        if fat_data is None:
+            bytes_per_sector = self.boot_sector.bytes_per_sector
+            self._advise(self.current_partition_offset + first_sector * bytes_per_sector,
+                         self.boot_sector.sectors_per_fat * bytes_per_sector, 'POSIX_FADV_WILLNEED')
+            fat_data = self.read_sectors(first_sector, self.boot_sector.sectors_per_fat)
+            self._fat_cache[fat_number] = fat_data
         return fat_data
 
+    def _invalidate_fat_cache(self):
+        """Drops the cached FATs and the structures decoded from them"""
+        self._fat_cache.clear()
+        self._entries_source = None
+        self._entries_type = None
+        self._entries = array('H')
+        self._pred_source = None
+        self._pred_map = {}
+        self._chains_source = None
+        self._chains = {}
+
     def read_root_directory(self) -> bytes:
         """Reads the complete root directory"""
         if not self.boot_sector:
@@ -280,50 +581,70 @@ class FAT16Parser:
         # The root directory starts after the FATs
         first_sector = self.boot_sector.reserved_sectors + (self.boot_sector.num_fats * self.boot_sector.sectors_per_fat)
 
-        # Read all sectors of the root directory
-        root_data = b''
-        for i in range(self.boot_sector.root_dir_sectors):
-            root_data += self.read_sector(first_sector + i)
-
-        return root_data
+        # Read the whole root directory at once, after asking the kernel to prefetch it
+        bytes_per_sector = self.boot_sector.bytes_per_sector
+        self._advise(self.current_partition_offset + first_sector * bytes_per_sector,
+                     self.boot_sector.root_dir_sectors * bytes_per_sector, 'POSIX_FADV_WILLNEED')
+        return self.read_sectors(first_sector, self.boot_sector.root_dir_sectors)
 
     def _get_fat12_entry(self, fat_data: bytes, cluster: int) -> int:
         """Returns the value of a FAT12 entry for a given cluster"""
-        # FAT12: 1.5 bytes per entry (12 bits)
-        # Entries are packed: offset = (cluster * 3) / 2
-        offset = (cluster * 3) // 2
-
-        if offset + 2 > len(fat_data):
+        # FAT12: 1.5 bytes per entry (12 bits), unpacked once into a 16-bit table
+        entries = self._get_fat_entries(fat_data, 'FAT12')
+        if cluster >= len(entries):
             return 0
+        return entries[cluster]
 
-        # Read 2 bytes
-        two_bytes = struct.unpack('<H', fat_data[offset:offset + 2])[0]
+    def _get_fat_entries(self, fat_data: bytes, fat_type: str) -> array:
+        """
+        Returns the FAT decoded as an array of integers (one item per cluster).
 
-        # Extract the correct 12 bits depending on whether cluster is even or odd
-        if cluster % 2 == 0:
-            # Even cluster: bits 0-11
-            return two_bytes & 0x0FFF
+        Decoding is done once and reused as long as the same fat_data object is
+        passed in for the same FAT type.
+        """
+        if self._entries_source is fat_data and self._entries_type == fat_type:
+            return self._entries
+
+        if fat_type == 'FAT12':
+            entries = _decode_fat12(fat_data)
         else:
-            # Odd cluster: bits 4-15
-            return (two_bytes >> 4) & 0x0FFF
+            # FAT16/FAT32: a single C-level copy of the little-endian entries
+            entries = array(_UINT32 if fat_type == 'FAT32' else 'H')
+            usable = len(fat_data) - (len(fat_data) % entries.itemsize)
+            entries.frombytes(fat_data[:usable])
+            if sys.byteorder == 'big':
+                entries.byteswap()
+
+        self._entries_source = fat_data
+        self._entries_type = fat_type
+        self._entries = entries
+        return entries
 
     def _get_fat16_entry(self, fat_data: bytes, cluster: int) -> int:
         """Returns the value of a FAT16 entry for a given cluster"""
         # FAT16: 2 bytes per entry (16 bits)
-        offset = cluster * 2
-        if offset + 2 > len(fat_data):
+        entries = self._get_fat_entries(fat_data, 'FAT16')
+        if cluster >= len(entries):
             return 0
-        return struct.unpack('<H', fat_data[offset:offset + 2])[0]
+        return entries[cluster]
 
     def _get_fat32_entry(self, fat_data: bytes, cluster: int) -> int:
         """Returns the value of a FAT32 entry for a given cluster"""
         # FAT32: 4 bytes per entry (32 bits, but only the lower 28 bits are used)
-        offset = cluster * 4
-        if offset + 4 > len(fat_data):
+        entries = self._get_fat_entries(fat_data, 'FAT32')
+        if cluster >= len(entries):
             return 0
-        value = struct.unpack('<I', fat_data[offset:offset + 4])[0]
         # Mask the upper 4 bits (reserved)
-        return value & 0x0FFFFFFF
+        return entries[cluster] & 0x0FFFFFFF
+
+    def _get_entry_table(self, fat_data: bytes) -> Tuple[array, int]:
+        """Returns (entries, mask) for the current FAT type"""
+        if self.fat_type == 'FAT12':
+            return self._get_fat_entries(fat_data, 'FAT12'), 0x0FFF
+        if self.fat_type == 'FAT32':
+            return self._get_fat_entries(fat_data, 'FAT32'), 0x0FFFFFFF
+        # By default, use FAT16
+        return self._get_fat_entries(fat_data, 'FAT16'), 0xFFFF
 
     def get_fat_entry(self, fat_data: bytes, cluster: int) -> int:
         """Returns the value of a FAT entry for a given cluster (automatically detects type)"""
@@ -339,23 +660,13 @@ class FAT16Parser:
 
     def _is_eof(self, value: int) -> bool:
         """Checks if a FAT value represents EOF (End Of File)"""
-        if self.fat_type == 'FAT12':
-            return value >= 0xFF8
-        elif self.fat_type == 'FAT16':
-            return value >= 0xFFF8
-        elif self.fat_type == 'FAT32':
-            return value >= 0x0FFFFFF8
-        return False
+        markers = _FAT_MARKERS.get(self.fat_type)
+        return markers is not None and value >= markers[0]
 
     def _is_bad_cluster(self, value: int) -> bool:
         """Checks if a FAT value represents a bad cluster"""
-        if self.fat_type == 'FAT12':
-            return value == 0xFF7
-        elif self.fat_type == 'FAT16':
-            return value == 0xFFF7
-        elif self.fat_type == 'FAT32':
-            return value == 0x0FFFFFF7
-        return False
+        markers = _FAT_MARKERS.get(self.fat_type)
+        return markers is not None and value == markers[1]
 
     def find_chain_start(self, fat_data: bytes, cluster: int) -> int:
         """
@@ -371,76 +682,124 @@ class FAT16Parser:
         if cluster < 2:
             return cluster
 
-        # Build a reverse map: cluster -> clusters that point to it
-        total_clusters = self.boot_sector.total_clusters
+        # Walk backwards through the predecessor map until we reach a cluster
+        # that no one points to (visited set protects against loops)
+        predecessors = self._get_predecessor_map(fat_data)
         visited = set()
         current = cluster
 
-        # Work backwards until we find a cluster that no one points to
-        max_iterations = 10000  # Protection against infinite loops
-        iterations = 0
-
-        while iterations < max_iterations:
+        while current in predecessors and current not in visited:
             visited.add(current)
-            found_predecessor = False
+            current = predecessors[current]
+
+        return current
 
-            # Search through all clusters to find one that points to current
-            for check_cluster in range(2, total_clusters + 2):
-                if check_cluster in visited:
-                    continue  # Skip clusters we've already checked
+    def _get_predecessor_map(self, fat_data: bytes) -> Dict[int, int]:
+        """
+        Returns a reverse FAT map: cluster -> first cluster whose entry points to it.
 
-                next_cluster = self.get_fat_entry(fat_data, check_cluster)
+        Built in a single pass over the FAT and reused as long as the same
+        fat_data object is passed in.
+        """
+        if self._pred_source is fat_data:
+            return self._pred_map
+
+        predecessors = {}
+        last_cluster = self.boot_sector.total_clusters + 2
+
+        # Entries past the end of the FAT read as 0 and are simply not visited.
+        # One slice of the entry array replaces per-cluster indexing; only
+        # FAT32 needs its reserved upper bits masked off
+        entries, mask = self._get_entry_table(fat_data)
+        next_clusters = entries[2:min(last_cluster, len(entries))]
+        if self.fat_type == 'FAT32':
+            next_clusters = map(mask.__and__, next_clusters)
+        set_predecessor = predecessors.setdefault
+        for check_cluster, next_cluster in enumerate(next_clusters, 2):
+            if next_cluster >= 2:
+                set_predecessor(next_cluster, check_cluster)
+
+        self._pred_source = fat_data
+        self._pred_map = predecessors
+        return predecessors
 
-                if next_cluster == current:
-                    # Found a cluster that points to current
-                    current = check_cluster
-                    found_predecessor = True
-                    break
+    def parse_fat_chain(self, fat_data: bytes, start_cluster: int) -> List[int]:
+        """Parses a FAT chain from a starting cluster (supports FAT12/16/32)"""
+        return self.parse_all_chains(fat_data, (start_cluster,))[start_cluster]
 
-            if not found_predecessor:
-                # No cluster points to current, so current is the start
-                return current
+    def parse_all_chains(self, fat_data: bytes, start_clusters: Iterable[int]) -> Dict[int, List[int]]:
+        """
+        Parses the FAT chains of several starting clusters in one call.
 
-            iterations += 1
+        The FAT view and the type-specific constants are resolved once for the
+        whole batch (e.g. every entry of a directory), and chains already walked
+        in the same fat_data object are returned from a cache.
 
-        # If we hit max iterations, return the current cluster
-        # (might be in a loop, but at least return something)
-        return current
+        Args:
+            fat_data: The FAT data
+            start_clusters: First cluster of each chain
 
-    def parse_fat_chain(self, fat_data: bytes, start_cluster: int) -> List[int]:
-        """Parses a FAT chain from a starting cluster (supports FAT12/16/32)"""
-        chain = [start_cluster]
-        current = start_cluster
-
-        while True:
-            next_cluster = self.get_fat_entry(fat_data, current)
-
-            # Special values
-            if self._is_eof(next_cluster):  # End of chain (EOF)
-                break
-            elif next_cluster == 0x0000:  # Free cluster
-                break
-            elif self._is_bad_cluster(next_cluster):  # Bad cluster
-                break
-            elif next_cluster < 2:  # Reserved
-                break
-
-            chain.append(next_cluster)
-            current = next_cluster
-
-            # Protection against infinite loops
-            if len(chain) > 10000:
+        Returns:
+            Dictionary start cluster -> chain (as returned by parse_fat_chain)
+
+        Raises:
+            ValueError: If one of the chains is too long or corrupted
+        """
+        # Type-specific constants are resolved once, not on every cluster
+        eof, bad = _FAT_MARKERS.get(self.fat_type, _FAT_MARKERS['FAT16'])
+        entries, mask = self._get_entry_table(fat_data)
+        size = len(entries)
+
+        if self._chains_source is not fat_data:
+            self._chains_source = fat_data
+            self._chains = {}
+        known_chains = self._chains
+
+        chains = {}
+        for start_cluster in start_clusters:
+            # Callers may edit the returned lists: hand out copies of cached chains
+            chain = known_chains.get(start_cluster)
+            if chain is not None:
+                chains[start_cluster] = chain.copy()
+                continue
+
+            chain = [start_cluster]
+            append = chain.append
+            current = start_cluster
+
+            # Protection against infinite loops: the loop bound replaces a length
+            # check on every step, at most 10000 clusters follow the start
+            for _ in range(10000):
+                if current < size:
+                    next_cluster = entries[current] & mask
+                else:
+                    next_cluster = 0
+
+                # End of chain (EOF), bad cluster, free (0x0000) or reserved cluster
+                if next_cluster >= eof or next_cluster == bad or next_cluster < 2:
+                    break
+
+                append(next_cluster)
+                current = next_cluster
+            else:
                 raise ValueError("FAT chain too long or corrupted")
 
-        return chain
+            known_chains[start_cluster] = chain
+            chains[start_cluster] = chain.copy()
+
+        return chains
 
     def get_info_dict(self) -> Dict:
-        """Returns a dictionary with all partition information"""
+        """Returns a dictionary with all partition information (built once per boot sector)"""
         if not self.boot_sector:
             return {}
 
+        # Callers get a copy: their edits must not leak into the cached dictionary
+        if self._info is not None:
+            return dict(self._info)
+
         bs = self.boot_sector
-        return {
+        self._info = {
             'bytes_per_sector': bs.bytes_per_sector,
             'sectors_per_cluster': bs.sectors_per_cluster,
             'reserved_sectors': bs.reserved_sectors,
@@ -457,6 +816,7 @@ class FAT16Parser:
             'volume_id': f"0x{bs.volume_id:08X}",
             'detected_fat_type': self.fat_type or 'Unknown',  # Automatically detected type
         }
+        return dict(self._info)
 
     def write_bytes_at_offset(self, offset: int, data: bytes):
         """
@@ -480,21 +840,34 @@ class FAT16Parser:
         if offset < 0:
             raise ValueError("Offset cannot be negative")
 
+        # A write overlapping the FATs makes the cached copies stale
+        if self.boot_sector:
+            fat_start = self.current_partition_offset + self._fat1_offset
+            fat_end = fat_start + self.boot_sector.num_fats * self._fat_size_bytes
+            if offset < fat_end and offset + len(data) > fat_start:
+                self._invalidate_fat_cache()
+
+        # Traces are checked once: tell() and data.hex() are only paid for when debugging
+        debug = logger.isEnabledFor(logging.DEBUG)
+
         # Position to the offset
-        print(f"[FAT16Parser] Seeking to offset 0x{offset:X}")
+        if debug:
+            logger.debug("Seeking to offset 0x%X", offset)
         self.file_handle.seek(offset)
 
-        current_pos = self.file_handle.tell()
-        print(f"[FAT16Parser] Current position: 0x{current_pos:X}")
+        if debug:
+            logger.debug("Current position: 0x%X", self.file_handle.tell())
 
         # Write the data
-        print(f"[FAT16Parser] Writing {len(data)} bytes: {data.hex()}")
+        if debug:
+            logger.debug("Writing %d bytes: %s", len(data), data.hex())
         bytes_written = self.file_handle.write(data)
-        print(f"[FAT16Parser] Bytes written: {bytes_written}")
 
         # Force write to disk
         self.file_handle.flush()
-        print(f"[FAT16Parser] Flush complete")
+        if debug:
+            logger.debug("Bytes written: %d", bytes_written)
+            logger.debug("Flush complete")
 
         return bytes_written
 
@@ -508,14 +881,15 @@ class FAT16Parser:
 
         # Save the path
         path = self.image_path
-        print(f"[FAT16Parser] Reopening file: {path}")
+        logger.debug("Reopening file: %s", path)
 
         # Close the current file
         self.close()
-        print(f"[FAT16Parser] File closed")
+        logger.debug("File closed")
 
         # Reopen in read/write mode
         self.file_handle = open(path, 'r+b')
-        print(f"[FAT16Parser] File reopened in mode: {self.file_handle.mode}")
+        self._attach_handle()
+        logger.debug("File reopened in mode: %s", self.file_handle.mode)
 
         return True
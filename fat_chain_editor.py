@@ -2,110 +2,365 @@
 Widget for visualizing and editing FAT chains
 """
 
-from typing import List, Optional, Callable
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-                              QLabel, QScrollArea, QFrame, QLineEdit, QMessageBox,
-                              QMenu, QTextEdit, QGridLayout, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QPoint
-from PyQt6.QtGui import QPainter, QColor, QPen, QAction, QFont
+import logging
+from array import array
+from functools import lru_cache, partial
+from typing import List, Optional, Callable, Sequence
+from qt_compat import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+                        QLabel, QScrollArea, QFrame, QLineEdit, QMessageBox,
+                        QMenu, QTextEdit, QSizePolicy, QInputDialog, QToolTip)
+from qt_compat import (Qt, pyqtSignal, QPoint, QRect, QRectF, QTimer, QEvent,
+                        mouse_pos)
+from qt_compat import (QPainter, QColor, QPen, QBrush, QAction, QFont, QFontMetrics,
+                        QPixmap, QPixmapCache)
+
+logger = logging.getLogger(__name__)
+
+
+def _block_style(name: str, background: str, hover: str, border: str, width: int, text: str,
+                 dashed: bool = False):
+    """Builds the painting tools of one block state: (name, brush, hover brush, border pen, text pen, inset)"""
+    border_pen = QPen(QColor(border), width)
+    if dashed:
+        border_pen.setStyle(Qt.PenStyle.DashLine)
+    return (name, QBrush(QColor(background)), QBrush(QColor(hover)), border_pen,
+            QPen(QColor(text)), width / 2)
+
+
+# Cluster block painting tools, built once for all views
+_BLOCK_EOF = _block_style("eof", "#FF6B6B", "#FA5252", "#C92A2A", 3, "white")
+_BLOCK_BROKEN = _block_style("broken", "#FFE66D", "#FFD43B", "#FFA500", 2, "#333333", dashed=True)
+_BLOCK_NORMAL = _block_style("normal", "#51CF66", "#69DB7C", "#2F9E44", 2, "white")
+_ARROW_PEN = QPen(QColor("#495057"))
+
+# Grid mode cell painting tools
+_GRID_EOF = _block_style("grid-eof", "#FFF3E0", "#FFE0B2", "#FF9800", 2, "black")
+_GRID_NORMAL = _block_style("grid", "#E3F2FD", "#BBDEFB", "#90CAF9", 1, "black")
+
+
+# Search result styles, selected through the line edit's objectName
+_SEARCH_STYLESHEET = """
+    QLineEdit#searchInfo { padding: 5px; background-color: #E8F4F8; border: 1px solid #90CAF9; border-radius: 3px; color: #1565C0; font-size: 9pt; }
+    QLineEdit#searchOk { padding: 5px; background-color: #E7F5E9; border: 1px solid #81C784; border-radius: 3px; color: #2E7D32; font-size: 9pt; font-weight: bold; }
+    QLineEdit#searchError { padding: 5px; background-color: #FFEBEE; border: 1px solid #EF5350; border-radius: 3px; color: #C62828; font-size: 9pt; font-weight: bold; }
+"""
+
+
+@lru_cache(maxsize=128)
+def _fragmentation_style(color: str, filled: int) -> str:
+    """Returns the fragmentation bar stylesheet for a filled percentage (1% steps, built once each)"""
+    stop = filled / 100
+    return (f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {color}, stop:{stop} {color}, "
+            f"stop:{stop} #E0E0E0, stop:1 #E0E0E0); color: #000; font-weight: bold; padding-left: 10px; "
+            f"border-radius: 3px; border: 1px solid #BDBDBD;")
+
+
+# Editor label styles, selected through the label's objectName: compact mode range
+# labels (contiguous range / single cluster), info label, empty chain
+_LABEL_STYLESHEET = """
+    QLabel#rangeContiguous { font-weight: bold; color: #2E7D32; background-color: #E7F5E9; padding: 5px 10px; border-radius: 3px; border: 1px solid #81C784; }
+    QLabel#rangeSingle { font-weight: bold; color: #1565C0; background-color: #E3F2FD; padding: 5px 10px; border-radius: 3px; border: 1px solid #90CAF9; }
+    QLabel#chainInfo { padding: 5px; background-color: #E9ECEF; border-radius: 3px; }
+    QLabel#emptyChain { padding: 20px; color: #999; font-style: italic; }
+"""
 
 
-class ClusterBlock(QLabel):
-    """Widget representing a cluster in a FAT chain"""
+class FATChainView(QWidget):
+    """Paints a whole FAT chain as a strip of cluster blocks joined by arrows"""
 
     clicked = pyqtSignal(int)
-    right_clicked = pyqtSignal(int, object)  # cluster_number, QPoint
+    right_clicked = pyqtSignal(int, int, object)  # cluster_number, position, QPoint
 
-    def __init__(self, cluster_number: int, position: int, is_last: bool = False, parent=None):
-        super().__init__(parent)
-        self.cluster_number = cluster_number
-        self.position = position
-        self.is_last = is_last  # Is this cluster the last one (EOF)?
-        self.is_broken = False
-        self.setup_ui()
+    BLOCK_W = 80
+    BLOCK_H = 50
+    ARROW_W = 40
+    STRIDE = BLOCK_W + ARROW_W
+    RADIUS = 5  # Block corner radius
 
-    def setup_ui(self):
-        """Configures the block's appearance"""
-        self.setFixedSize(80, 50)
-        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
-        self.setLineWidth(2)
-        self.update_display()
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._chain = array('I')
+        self._broken = bytearray()  # One flag per chain position
+        self._hover = -1  # Position under the mouse
+        self.setMouseTracking(True)
+        self._update_size()
+        self._update_fonts()
         # Note: setCursor may cause warnings with some Qt versions
         try:
             self.setCursor(Qt.CursorShape.PointingHandCursor)
         except:
             pass  # Ignore if it doesn't work
 
-        # Context menu
-        self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.customContextMenuRequested.connect(self._show_context_menu)
-
-    def update_display(self):
-        """Updates the cluster display"""
-        if self.is_last:
-            # This cluster is the last one (EOF)
-            self.setText(f"Cluster\n{self.cluster_number}\n[EOF]")
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: #FF6B6B;
-                    color: white;
-                    font-weight: bold;
-                    border: 3px solid #C92A2A;
-                    border-radius: 5px;
-                }
-                QLabel:hover {
-                    background-color: #FA5252;
-                }
-            """)
-        elif self.is_broken:
-            self.setText(f"Cluster\n{self.cluster_number}\n⚠")
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: #FFE66D;
-                    color: #333;
-                    font-weight: bold;
-                    border: 2px dashed #FFA500;
-                    border-radius: 5px;
-                }
-                QLabel:hover {
-                    background-color: #FFD43B;
-                }
-            """)
-        else:
-            self.setText(f"Cluster\n{self.cluster_number}")
-            self.setStyleSheet("""
-                QLabel {
-                    background-color: #51CF66;
-                    color: white;
-                    font-weight: bold;
-                    border: 2px solid #2F9E44;
-                    border-radius: 5px;
-                }
-                QLabel:hover {
-                    background-color: #69DB7C;
-                }
-            """)
-
-    def set_last(self, is_last: bool):
-        """Marks this block as last (EOF)"""
-        self.is_last = is_last
-        self.update_display()
-
-    def set_broken(self, is_broken: bool):
-        """Marks this block as broken"""
-        self.is_broken = is_broken
-        self.update_display()
+    def _update_fonts(self):
+        """Derives the block and arrow fonts from the widget font"""
+        self._block_font = QFont(self.font())
+        self._block_font.setBold(True)
+        self._arrow_font = QFont(self.font())
+        self._arrow_font.setPointSize(20)
+
+    def changeEvent(self, event):
+        """Follows font changes (e.g. inherited from the parent)"""
+        if event.type() == QEvent.Type.FontChange:
+            self._update_fonts()
+        super().changeEvent(event)
+
+    def set_chain(self, chain: Sequence[int]):
+        """Sets the chain to paint (a snapshot: later edits need another set_chain)"""
+        self._chain = array('I', chain)
+        self._broken = bytearray(len(chain))
+        self._hover = -1
+        self._update_size()
+        self.update()
+
+    def append_cluster(self, cluster: int):
+        """Appends one cluster, repainting only the previous EOF block and the new one"""
+        self._chain.append(cluster)
+        self._broken.append(0)
+        self._update_size()
+        last = len(self._chain) - 1
+        self.update(self._block_rect(last).united(self._block_rect(max(0, last - 1))))
+
+    def truncate(self, length: int):
+        """Keeps the first length clusters, the new last block is repainted as EOF"""
+        del self._chain[length:]
+        del self._broken[length:]
+        if self._hover >= length:
+            self._hover = -1
+        self._update_size()
+        self.update(self._block_rect(length - 1))
+
+    def remove_at(self, position: int):
+        """Removes the cluster at the given position, the following blocks move back by one"""
+        del self._chain[position]
+        del self._broken[position]
+        self._hover = -1
+        self._update_size()
+        self.update()  # Only the exposed part is actually painted
+
+    def set_broken(self, position: int, is_broken: bool):
+        """Marks the cluster at the given position as broken"""
+        self._broken[position] = is_broken
+        self.update(self._block_rect(position))
+
+    def _update_size(self):
+        """Sizes the widget to hold the whole chain"""
+        self.setFixedSize(max(0, len(self._chain) * self.STRIDE - self.ARROW_W), self.BLOCK_H)
+
+    def position_at(self, pos) -> int:
+        """Returns the chain position of the block under pos, or -1"""
+        x, y = pos.x(), pos.y()
+        if x < 0 or not 0 <= y < self.BLOCK_H or x % self.STRIDE >= self.BLOCK_W:
+            return -1
+        position = x // self.STRIDE
+        return position if position < len(self._chain) else -1
+
+    def _block_rect(self, position: int) -> QRect:
+        """Returns the rectangle of the block at the given position"""
+        return QRect(position * self.STRIDE, 0, self.BLOCK_W, self.BLOCK_H)
+
+    def _block_pixmap(self, style, hovered: bool) -> QPixmap:
+        """Returns the rendered background of a block state, from QPixmapCache when possible"""
+        name, brush, hover_brush, border_pen, _, inset = style
+        dpr = self.devicePixelRatioF()
+        key = f"fatchain/{name}/{int(hovered)}/{dpr}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            # Antialiased rounded rectangle rasterized once per state, then only blitted
+            pixmap = QPixmap(round(self.BLOCK_W * dpr), round(self.BLOCK_H * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(border_pen)
+            painter.setBrush(hover_brush if hovered else brush)
+            painter.drawRoundedRect(QRectF(0, 0, self.BLOCK_W, self.BLOCK_H).adjusted(inset, inset, -inset, -inset),
+                                    self.RADIUS, self.RADIUS)
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def _arrow_pixmap(self) -> QPixmap:
+        """Returns the "→" between two blocks, shaped and rendered once per font"""
+        dpr = self.devicePixelRatioF()
+        key = f"fatchain/arrow/{dpr}/{self._arrow_font.key()}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(round(self.ARROW_W * dpr), round(self.BLOCK_H * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(_ARROW_PEN)
+            painter.setFont(self._arrow_font)
+            painter.drawText(QRect(0, 0, self.ARROW_W, self.BLOCK_H), Qt.AlignmentFlag.AlignCenter, "→")
+            painter.end()
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
+    def paintEvent(self, event):
+        """Paints the blocks and arrows intersecting the exposed area (O(visible), not O(chain))"""
+        chain = self._chain
+        if not chain:
+            return
+        last = len(chain) - 1
+        broken = self._broken
+        exposed = event.rect()
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self._block_font)
+        arrow = self._arrow_pixmap()
+
+        # Only the positions intersecting the exposed area are visited
+        first = max(0, exposed.left() // self.STRIDE)
+        stop = min(len(chain), exposed.right() // self.STRIDE + 1)
+        for i in range(first, stop):
+            cluster = chain[i]
+            block = self._block_rect(i)
+
+            if i == last:
+                style = _BLOCK_EOF
+                text = f"Cluster\n{cluster}\n[EOF]"
+            elif broken[i]:
+                style = _BLOCK_BROKEN
+                text = f"Cluster\n{cluster}\n⚠"
+            else:
+                style = _BLOCK_NORMAL
+                text = f"Cluster\n{cluster}"
+
+            painter.drawPixmap(block.topLeft(), self._block_pixmap(style, i == self._hover))
+
+            painter.setPen(style[4])  # Text pen
+            painter.drawText(block, Qt.AlignmentFlag.AlignCenter, text)
+
+            # Arrow between clusters (except after the last one)
+            if i < last:
+                painter.drawPixmap(block.right() + 1, 0, arrow)
+
+    def mouseMoveEvent(self, event):
+        """Tracks the hovered block"""
+        self._set_hover(self.position_at(mouse_pos(event)))
+
+    def leaveEvent(self, event):
+        """Clears the hover highlight"""
+        self._set_hover(-1)
+
+    def _set_hover(self, position: int):
+        """Moves the hover highlight, repainting only the two affected blocks"""
+        if position != self._hover:
+            if self._hover >= 0:
+                self.update(self._block_rect(self._hover))
+            self._hover = position
+            if position >= 0:
+                self.update(self._block_rect(position))
 
     def mousePressEvent(self, event):
         """Handles cluster click"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self.cluster_number)
-            print(f"[ClusterBlock] Clicked cluster {self.cluster_number}")
-
-    def _show_context_menu(self, pos):
+            position = self.position_at(mouse_pos(event))
+            if position >= 0:
+                cluster_number = self._chain[position]
+                self.clicked.emit(cluster_number)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Clicked cluster %d", cluster_number)
+
+    def contextMenuEvent(self, event):
         """Shows the context menu"""
-        self.right_clicked.emit(self.cluster_number, self.mapToGlobal(pos))
+        position = self.position_at(event.pos())
+        if position >= 0:
+            self.right_clicked.emit(self._chain[position], position, event.globalPos())
+
+
+class FATChainGrid(FATChainView):
+    """Paints a whole FAT chain as a grid of numbered cells"""
+
+    BLOCK_W = 50
+    BLOCK_H = 25
+    RADIUS = 2
+    COLS = 15  # Cells per row
+    SPACING = 2
+    MARGIN = 5
+    X_STRIDE = BLOCK_W + SPACING
+    Y_STRIDE = BLOCK_H + SPACING
+
+    def _update_fonts(self):
+        """Derives the cell fonts (normal and EOF) from the widget font"""
+        self._block_font = QFont(self.font())
+        self._block_font.setPointSize(9)
+        self._eof_font = QFont(self._block_font)
+        self._eof_font.setBold(True)
+
+    def _update_size(self):
+        """Sizes the widget to hold the whole chain"""
+        count = len(self._chain)
+        cols = min(count, self.COLS)
+        rows = -(-count // self.COLS)
+        self.setFixedSize(2 * self.MARGIN + max(0, cols * self.X_STRIDE - self.SPACING),
+                          2 * self.MARGIN + max(0, rows * self.Y_STRIDE - self.SPACING))
+
+    def position_at(self, pos) -> int:
+        """Returns the chain position of the cell under pos, or -1"""
+        x, y = pos.x() - self.MARGIN, pos.y() - self.MARGIN
+        if (x < 0 or y < 0 or x % self.X_STRIDE >= self.BLOCK_W or y % self.Y_STRIDE >= self.BLOCK_H
+                or x // self.X_STRIDE >= self.COLS):
+            return -1
+        position = (y // self.Y_STRIDE) * self.COLS + x // self.X_STRIDE
+        return position if position < len(self._chain) else -1
+
+    def _block_rect(self, position: int) -> QRect:
+        """Returns the rectangle of the cell at the given position"""
+        row, col = divmod(position, self.COLS)
+        return QRect(self.MARGIN + col * self.X_STRIDE, self.MARGIN + row * self.Y_STRIDE,
+                     self.BLOCK_W, self.BLOCK_H)
+
+    def truncate(self, length: int):
+        """Keeps the first length clusters, repainting the rows from the new EOF cell to the old last cell"""
+        first_row = max(0, length - 1) // self.COLS
+        last_row = max(0, len(self._chain) - 1) // self.COLS
+        # The widget keeps its width, the removed cells are cleared by this repaint
+        dirty = QRect(0, self.MARGIN + first_row * self.Y_STRIDE, self.width(),
+                      (last_row - first_row + 1) * self.Y_STRIDE)
+        super().truncate(length)
+        self.update(dirty)
+
+    def paintEvent(self, event):
+        """Paints the rows of cells intersecting the exposed area"""
+        chain = self._chain
+        if not chain:
+            return
+        last = len(chain) - 1
+        exposed = event.rect()
+
+        painter = QPainter(self)
+        painter.setFont(self._block_font)
+        painter.setPen(_GRID_NORMAL[4])
+
+        # Only the rows intersecting the exposed area are visited
+        first = max(0, (exposed.top() - self.MARGIN) // self.Y_STRIDE) * self.COLS
+        stop = min(len(chain), ((exposed.bottom() - self.MARGIN) // self.Y_STRIDE + 1) * self.COLS)
+        for i in range(first, stop):
+            cell = self._block_rect(i)
+            if i == last:
+                painter.drawPixmap(cell.topLeft(), self._block_pixmap(_GRID_EOF, i == self._hover))
+                painter.setFont(self._eof_font)
+                painter.setPen(_GRID_EOF[4])
+            else:
+                painter.drawPixmap(cell.topLeft(), self._block_pixmap(_GRID_NORMAL, i == self._hover))
+            painter.drawText(cell, Qt.AlignmentFlag.AlignCenter, str(chain[i]))
+
+    def event(self, event):
+        """Shows the tooltip of the cell under the mouse"""
+        if event.type() == QEvent.Type.ToolTip:
+            position = self.position_at(event.pos())
+            if position < 0:
+                QToolTip.hideText()
+                event.ignore()
+            elif position == len(self._chain) - 1:
+                QToolTip.showText(event.globalPos(), f"Cluster {self._chain[position]} [EOF - Last cluster]", self)
+            else:
+                QToolTip.showText(event.globalPos(), f"Cluster {self._chain[position]} - Right-click for options", self)
+            return True
+        return super().event(event)
 
 
 class FATChainEditor(QWidget):
@@ -115,18 +370,39 @@ class FATChainEditor(QWidget):
     cluster_selected = pyqtSignal(int)  # Selected cluster
     save_requested = pyqtSignal()  # Signal to request save
 
+    COMPACT_PAGE = 500  # Ranges shown per compact mode page
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.chain: List[int] = []
-        self.cluster_blocks: List[ClusterBlock] = []
+        self.chain: Sequence[int] = array('I')  # Cluster numbers, 4 bytes each once owned
+        self._chain_owned = True  # False while self.chain is the caller's sequence
+        self._last_info = ""  # Text currently shown by info_label
+        self._ranges_cache = None  # analyze_ranges() result for the current chain
+        self._compact_page = 0  # Page of ranges shown in compact mode
+        self._emit_pending = False  # chain_modified owed by the next refresh
+        self._display_dirty = False  # The next refresh has to rebuild the display
+        self._refreshing = False  # True while _do_refresh() runs
+        self._displayed_len = -1  # Clusters shown by the grid/full display, -1 if not appendable
+        self._chain_displayed = False  # A display has been built for the current chain
         self.on_cluster_click: Optional[Callable] = None
         self.display_mode = "grid"  # "compact", "grid", or "full" - Grid par défaut
+
+        # Edits, set_chain and mode changes only start this timer: everything
+        # requested within one frame gives one rebuild and one chain_modified
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(16)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+
         self.setup_ui()
 
     def setup_ui(self):
         """Initializes the interface"""
         layout = QVBoxLayout()
 
+        # Shared search result and label styles, parsed once for the whole editor
+        self.setStyleSheet(_SEARCH_STYLESHEET + _LABEL_STYLESHEET)
+
         # Header with buttons
         header_layout = QHBoxLayout()
 
@@ -176,7 +452,7 @@ class FATChainEditor(QWidget):
         # Search result (FAT offset + Data offset)
         self.search_result_label = QLineEdit("Search for a cluster to see its offsets")
         self.search_result_label.setReadOnly(True)
-        self.search_result_label.setStyleSheet("QLineEdit { padding: 5px; background-color: #E8F4F8; border: 1px solid #90CAF9; border-radius: 3px; color: #1565C0; font-size: 9pt; }")
+        self.search_result_label.setObjectName("searchInfo")
         layout.addWidget(self.search_result_label)
 
         # Scrollable area to display the chain
@@ -187,36 +463,116 @@ class FATChainEditor(QWidget):
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
 
         self.chain_container = QWidget()
-        self.chain_layout = QHBoxLayout()
-        self.chain_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.chain_layout.setContentsMargins(10, 10, 10, 10)
-        self.chain_container.setLayout(self.chain_layout)
+        self._install_chain_layout()
+
+        # Full and grid mode views, kept across refreshes
+        self.chain_view = FATChainView()
+        self.chain_grid = FATChainGrid()
+        for view in (self.chain_view, self.chain_grid):
+            view.clicked.connect(self._on_cluster_clicked)
+            view.right_clicked.connect(self._on_cluster_right_clicked)
+
+        # Compact mode view: fragmentation bar, then one label and one arrow
+        # per range of the page, reconfigured in place by each refresh
+        self.compact_view = QWidget()
+        self._compact_layout = QHBoxLayout()
+        self._compact_layout.setContentsMargins(0, 0, 0, 0)
+        self._compact_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.compact_view.setLayout(self._compact_layout)
+        self._frag_bar = QLabel()
+        self._frag_bar.setFixedHeight(20)
+        self._compact_layout.addWidget(self._frag_bar)
+        self._range_labels: List[QLabel] = []
+        self._range_kinds: List[Optional[bool]] = []  # is_contiguous each label is styled for
+        self._arrow_pool: List[QLabel] = []  # Arrow after each range label
+        self._arrow_pixmap: Optional[QPixmap] = None  # Shared by all arrow labels
+        self._compact_items: List[tuple] = []  # (cluster, position) shown by each range label
+
+        # Widgets that survive refresh_display (hidden, not deleted)
+        self._empty_label: Optional[QLabel] = None
+        self._pooled_widgets = {self.chain_view, self.chain_grid, self.compact_view}
 
         scroll.setWidget(self.chain_container)
         layout.addWidget(scroll)
+        self.chain_scroll = scroll
+
+        # Compact mode pages (only shown when the ranges do not fit in one page)
+        self.pager = QWidget()
+        pager_layout = QHBoxLayout()
+        pager_layout.setContentsMargins(0, 0, 0, 0)
+        self.prev_page_btn = QPushButton("◀ Prev")
+        self.prev_page_btn.clicked.connect(lambda: self._change_compact_page(-1))
+        pager_layout.addWidget(self.prev_page_btn)
+        self.page_label = QLabel()
+        pager_layout.addWidget(self.page_label)
+        self.next_page_btn = QPushButton("Next ▶")
+        self.next_page_btn.clicked.connect(lambda: self._change_compact_page(1))
+        pager_layout.addWidget(self.next_page_btn)
+        pager_layout.addStretch()
+        self.pager.setLayout(pager_layout)
+        self.pager.hide()
+        layout.addWidget(self.pager)
 
         # Chain information
         self.info_label = QLabel("No chain loaded")
-        self.info_label.setStyleSheet("padding: 5px; background-color: #E9ECEF; border-radius: 3px;")
+        self.info_label.setObjectName("chainInfo")
         layout.addWidget(self.info_label)
 
         self.setLayout(layout)
 
-    def set_chain(self, chain: List[int]):
-        """Sets the cluster chain to display"""
-        self.chain = chain.copy()
+        # Cluster context menu, built once and shared by all display modes
+        self._ctx_cluster = 0
+        self._ctx_position = -1
+        self._ctx_menu = QMenu(self)
+        self._view_action = self._ctx_menu.addAction("")
+        self._ctx_menu.addSeparator()
+        self._eof_action = self._ctx_menu.addAction("🔚 Mark as last (EOF)")
+        self._ctx_menu.addSeparator()
+        self._remove_action = self._ctx_menu.addAction("")
+        self._ctx_menu.triggered.connect(self._on_context_action)
+
+    def set_chain(self, chain: Sequence[int], copy: bool = True):
+        """Sets the cluster chain to display, copied unless copy is False (the caller must then leave chain alone)"""
+        if self._chain_displayed and self._same_chain(chain):
+            # Same content again (e.g. the same search): the display is already right
+            self._emit_pending = False  # Pending edits are superseded
+            return
+
+        self.chain = array('I', chain) if copy else chain
+        self._chain_owned = copy
+        self._chain_displayed = False
+        self._emit_pending = False  # Pending edits are superseded
+        self._ranges_cache = None
+        self._compact_page = 0
         self.refresh_display()
 
+    def _same_chain(self, chain: Sequence[int]) -> bool:
+        """Tells whether chain has the same content as a different current chain object"""
+        current = self.chain
+        if chain is current or len(chain) != len(current):
+            return False  # The same object may have been edited in place since
+        if type(chain) is type(current):
+            return chain == current
+        return list(chain) == list(current)
+
     def set_search_result(self, text: str):
         """Sets the search result text"""
         self.search_result_label.setText(text)
-        # Style according to message type
+        # Style according to message type (rules in _SEARCH_STYLESHEET)
         if text.startswith("✅") or "Cluster" in text:
-            self.search_result_label.setStyleSheet("QLineEdit { padding: 5px; background-color: #E7F5E9; border: 1px solid #81C784; border-radius: 3px; color: #2E7D32; font-size: 9pt; font-weight: bold; }")
+            name = "searchOk"
         elif text.startswith("❌"):
-            self.search_result_label.setStyleSheet("QLineEdit { padding: 5px; background-color: #FFEBEE; border: 1px solid #EF5350; border-radius: 3px; color: #C62828; font-size: 9pt; font-weight: bold; }")
+            name = "searchError"
         else:
-            self.search_result_label.setStyleSheet("QLineEdit { padding: 5px; background-color: #E8F4F8; border: 1px solid #90CAF9; border-radius: 3px; color: #1565C0; font-size: 9pt; }")
+            name = "searchInfo"
+
+        # Only repolish when the message type changes
+        label = self.search_result_label
+        if label.objectName() != name:
+            label.setObjectName(name)
+            style = label.style()
+            style.unpolish(label)
+            style.polish(label)
 
     def set_display_mode(self, mode: str):
         """Changes the display mode"""
@@ -229,31 +585,31 @@ class FATChainEditor(QWidget):
         self.refresh_display()
 
     def analyze_ranges(self):
-        """Analyzes the chain to find contiguous ranges"""
+        """Analyzes the chain to find contiguous ranges (cached until the chain changes)"""
+        if self._ranges_cache is not None:
+            return self._ranges_cache
+
         if not self.chain:
-            return []
+            self._ranges_cache = []
+            return self._ranges_cache
 
+        # One pass over the chain iterator: no indexing, and the count of a
+        # range is derived from its bounds instead of being incremented
         ranges = []
-        start = self.chain[0]
-        prev = start
-        count = 1
-
-        for i in range(1, len(self.chain)):
-            curr = self.chain[i]
-            # Check if contiguous
-            if curr == prev + 1:
-                count += 1
-                prev = curr
-            else:
-                # End of range, save it
-                ranges.append((start, prev, count, True))  # (start, end, count, is_contiguous)
+        it = iter(self.chain)
+        start = prev = next(it)
+
+        for curr in it:
+            # Break in contiguity: save the range that just ended
+            if curr != prev + 1:
+                ranges.append((start, prev, prev - start + 1, True))  # (start, end, count, is_contiguous)
                 start = curr
-                prev = curr
-                count = 1
+            prev = curr
 
         # Add last range
-        ranges.append((start, prev, count, count > 1))
+        ranges.append((start, prev, prev - start + 1, prev != start))
 
+        self._ranges_cache = ranges
         return ranges
 
     def calculate_fragmentation(self):
@@ -279,39 +635,81 @@ class FATChainEditor(QWidget):
             return ((num_ranges - 1) / (total_clusters - 1)) * 100.0
 
     def refresh_display(self):
-        """Refreshes the chain display based on current mode"""
+        """Schedules a refresh of the chain display (at most one per frame)"""
+        self._display_dirty = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def flush_display(self):
+        """Runs the scheduled refresh now, for callers that need the display up to date immediately"""
+        self._do_refresh()
+
+    def _do_refresh(self):
+        """Rebuilds the chain display if needed, then emits pending edits"""
+        if self._refreshing:
+            # Re-entered (e.g. from an event processed during the rebuild or
+            # from a chain_modified slot): run again once this one is done
+            self._refresh_timer.start()
+            return
+
+        self._refreshing = True
+        try:
+            self._refresh_timer.stop()  # When flushed, the scheduled refresh is done here
+            if self._display_dirty:
+                self._display_dirty = False
+                self._rebuild_display()
+            if self._emit_pending:
+                self._emit_pending = False
+                self.chain_modified.emit(self.chain.tolist())
+        finally:
+            self._refreshing = False
+
+    def _rebuild_display(self):
+        """Rebuilds the chain display based on current mode"""
         import time
         start = time.time()
 
-        # Clear ALL child widgets from the layout
-        while self.chain_layout.count():
-            item = self.chain_layout.takeAt(0)
-            if item is not None:
-                widget = item.widget()
-                if widget is not None:
-                    widget.setParent(None)
-                    widget.deleteLater()
-
-        self.cluster_blocks.clear()
-
-        if not self.chain:
-            empty_label = QLabel("Empty chain - Click 'Add' to start")
-            empty_label.setStyleSheet("padding: 20px; color: #999; font-style: italic;")
-            empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.chain_layout.addWidget(empty_label)
-            self.chain_layout.addStretch()
-            self.info_label.setText("Empty chain")
-            return
+        # Batch all layout changes into a single repaint
+        self.chain_container.setUpdatesEnabled(False)
+        self._displayed_len = -1
+        self._chain_displayed = True
+        try:
+            self._clear_chain_layout()
+            if self.display_mode != "compact" or not self.chain:
+                self.pager.hide()
+
+            if not self.chain:
+                if self._empty_label is None:
+                    self._empty_label = QLabel("Empty chain - Click 'Add' to start")
+                    self._empty_label.setObjectName("emptyChain")
+                    self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                    self._pooled_widgets.add(self._empty_label)
+                self.chain_layout.addWidget(self._empty_label)
+                self._empty_label.show()
+                self.chain_layout.addStretch()
+                self._set_info("Empty chain")
+                return
+
+            # Display according to mode
+            if self.display_mode == "compact":
+                self._display_compact()
+            elif self.display_mode == "grid":
+                self._display_grid()
+                self._displayed_len = len(self.chain)
+            else:  # "full"
+                self._display_full()
+                self._displayed_len = len(self.chain)
+        finally:
+            self.chain_container.setUpdatesEnabled(True)
+
+        self._update_info()
 
-        # Display according to mode
-        if self.display_mode == "compact":
-            self._display_compact()
-        elif self.display_mode == "grid":
-            self._display_grid()
-        else:  # "full"
-            self._display_full()
+        elapsed = (time.time() - start) * 1000
+        if elapsed > 5:
+            print(f"[CHAIN EDITOR] _rebuild_display ({self.display_mode}): {elapsed:.1f}ms for {len(self.chain)} clusters")
 
-        # Update info label
+    def _update_info(self):
+        """Updates the info label from the chain and its ranges"""
         total_size = len(self.chain)
         ranges = self.analyze_ranges()
         fragmentation = self.calculate_fragmentation()
@@ -324,160 +722,190 @@ class FATChainEditor(QWidget):
             info_parts.append(f"Start: {self.chain[0]}")
             info_parts.append(f"End: {self.chain[-1]}")
 
-        self.info_label.setText(" | ".join(info_parts))
+        self._set_info(" | ".join(info_parts))
 
-        elapsed = (time.time() - start) * 1000
-        if elapsed > 5:
-            print(f"[CHAIN EDITOR] refresh_display ({self.display_mode}): {elapsed:.1f}ms for {len(self.chain)} clusters")
+    def _set_info(self, text: str):
+        """Updates the info label, skipping the repaint when the text is unchanged"""
+        if text != self._last_info:
+            self._last_info = text
+            self.info_label.setText(text)
+
+    def _install_chain_layout(self):
+        """Gives the chain container a fresh, empty layout"""
+        self.chain_layout = QHBoxLayout()
+        self.chain_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self.chain_layout.setContentsMargins(10, 10, 10, 10)
+        self.chain_container.setLayout(self.chain_layout)
+
+    def _clear_chain_layout(self):
+        """Drops the chain layout in one go, keeping pooled widgets"""
+        old_layout = self.chain_layout
+        pooled = self._pooled_widgets
+        for i in reversed(range(old_layout.count())):
+            widget = old_layout.itemAt(i).widget()
+            if widget is not None and widget in pooled:
+                old_layout.takeAt(i)
+                widget.hide()
+
+        # A throwaway widget takes the old layout and all its widgets,
+        # they are destroyed together instead of one takeAt/deleteLater each
+        trash = QWidget()
+        trash.setLayout(old_layout)
+        trash.deleteLater()
+
+        self._install_chain_layout()
 
     def _display_compact(self):
         """Displays chain in compact ranges view"""
         ranges = self.analyze_ranges()
 
         # Fragmentation bar
-        fragmentation = self.calculate_fragmentation()
-        frag_widget = self._create_fragmentation_bar(fragmentation)
-        self.chain_layout.addWidget(frag_widget)
+        self._update_fragmentation_bar(self.calculate_fragmentation())
+
+        # Current page of ranges (the page is kept valid after edits)
+        page_count = max(1, -(-len(ranges) // self.COMPACT_PAGE))
+        self._compact_page = min(self._compact_page, page_count - 1)
+        first = self._compact_page * self.COMPACT_PAGE
+        stop = min(len(ranges), first + self.COMPACT_PAGE)
+        self._update_pager(first, stop, len(ranges))
+
+        # Ranges display: the pooled labels are only updated where they differ
+        # (the view is hidden meanwhile, so showing them costs no relayout)
+        labels = self._range_labels
+        kinds = self._range_kinds
+        arrows = self._arrow_pool
+        items = self._compact_items = []
+        last_index = len(ranges) - 1
+        position = sum(r[2] for r in ranges[:first])  # Chain position of each range's first cluster
+        for slot, (start, end, count, is_contiguous) in enumerate(ranges[first:stop]):
+            if slot == len(labels):
+                self._add_compact_slot()
+            range_label = labels[slot]
+
+            if kinds[slot] != is_contiguous:
+                # Rules in _LABEL_STYLESHEET, repolished only when the kind changes
+                first_use = kinds[slot] is None
+                kinds[slot] = is_contiguous
+                range_label.setObjectName("rangeContiguous" if is_contiguous else "rangeSingle")
+                if not first_use:
+                    style = range_label.style()
+                    style.unpolish(range_label)
+                    style.polish(range_label)
 
-        # Ranges display
-        for start, end, count, is_contiguous in ranges:
             if is_contiguous:
                 # Contiguous range
-                range_label = QLabel(f"[{start}→{end}]")
-                range_label.setStyleSheet("font-weight: bold; color: #2E7D32; background-color: #E7F5E9; padding: 5px 10px; border-radius: 3px; border: 1px solid #81C784;")
+                range_label.setText(f"[{start}→{end}]")
                 range_label.setToolTip(f"Contiguous range: {count} clusters ({start} to {end})\nLeft-click: view • Right-click: edit")
             else:
                 # Single cluster
-                range_label = QLabel(f"[{start}]")
-                range_label.setStyleSheet("font-weight: bold; color: #1565C0; background-color: #E3F2FD; padding: 5px 10px; border-radius: 3px; border: 1px solid #90CAF9;")
+                range_label.setText(f"[{start}]")
                 range_label.setToolTip(f"Single cluster: {start}\nLeft-click: view • Right-click: edit")
+            range_label.show()
 
-            # Make clickable
-            range_label.mousePressEvent = lambda e, s=start: self._handle_compact_click(e, s)
-            range_label.setCursor(Qt.CursorShape.PointingHandCursor)
-
-            # Enable context menu
-            range_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            range_label.customContextMenuRequested.connect(
-                lambda pos, s=start, lbl=range_label: self._on_cluster_right_clicked(s, lbl.mapToGlobal(pos))
-            )
+            # Arrow if not last, also after the last range of a page followed by others
+            arrows[slot].setVisible(first + slot < last_index)
 
-            self.chain_layout.addWidget(range_label)
+            items.append((start, position))
+            position += count
 
-            # Add arrow if not last
-            if (start, end, count, is_contiguous) != ranges[-1]:
-                arrow = QLabel("→")
-                arrow.setStyleSheet("font-size: 14pt; color: #666; padding: 0 3px;")
-                self.chain_layout.addWidget(arrow)
+        # Slots beyond this page stay pooled, hidden
+        for slot in range(stop - first, len(labels)):
+            labels[slot].hide()
+            arrows[slot].hide()
 
+        self.chain_layout.addWidget(self.compact_view)
+        self.compact_view.show()
         self.chain_layout.addStretch()
 
-    def _handle_compact_click(self, event, cluster):
+    def _add_compact_slot(self):
+        """Adds a range label and its arrow to the compact view pool"""
+        slot = len(self._range_labels)
+        range_label = QLabel()
+
+        # Make clickable, the slot finds its range in _compact_items
+        range_label.mousePressEvent = partial(self._handle_compact_click, slot=slot)
+        range_label.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        # Enable context menu
+        range_label.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        range_label.customContextMenuRequested.connect(partial(self._show_compact_context_menu, slot))
+
+        arrow = QLabel()
+        arrow.setPixmap(self._compact_arrow_pixmap())
+
+        self._compact_layout.addWidget(range_label)
+        self._compact_layout.addWidget(arrow)
+        self._range_labels.append(range_label)
+        self._range_kinds.append(None)
+        self._arrow_pool.append(arrow)
+
+    def _compact_arrow_pixmap(self) -> QPixmap:
+        """Returns the "→" shown between compact ranges, shaped and rendered once"""
+        if self._arrow_pixmap is None:
+            font = QFont(self.font())
+            font.setPointSize(14)
+            metrics = QFontMetrics(font)
+            # Same width as the former styled text label: 3px padding and
+            # QLabel's text indent (half an "x") on each side
+            width = metrics.horizontalAdvance("→") + 6 + metrics.horizontalAdvance("x")
+            height = metrics.height()
+
+            dpr = self.devicePixelRatioF()
+            pixmap = QPixmap(round(width * dpr), round(height * dpr))
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            painter.setPen(QColor("#666666"))
+            painter.setFont(font)
+            painter.drawText(QRect(0, 0, width, height), Qt.AlignmentFlag.AlignCenter, "→")
+            painter.end()
+            self._arrow_pixmap = pixmap
+        return self._arrow_pixmap
+
+    def _update_pager(self, first: int, stop: int, total: int):
+        """Shows the compact mode pager when the ranges span several pages"""
+        paged = total > self.COMPACT_PAGE
+        if paged:
+            self.page_label.setText(f"Ranges {first + 1}-{stop} of {total}")
+            self.prev_page_btn.setEnabled(first > 0)
+            self.next_page_btn.setEnabled(stop < total)
+        self.pager.setVisible(paged)
+
+    def _change_compact_page(self, delta: int):
+        """Moves to the previous (-1) or next (+1) page of compact mode ranges"""
+        self._compact_page = max(0, self._compact_page + delta)
+        self.chain_scroll.horizontalScrollBar().setValue(0)
+        self.refresh_display()
+
+    def _handle_compact_click(self, event, slot):
         """Handle clicks on compact view labels"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self._on_cluster_clicked(cluster)
+            self._on_cluster_clicked(self._compact_items[slot][0])
+
+    def _show_compact_context_menu(self, slot: int, pos: QPoint):
+        """Shows the context menu of a compact view range (first cluster of the range)"""
+        cluster, position = self._compact_items[slot]
+        self._on_cluster_right_clicked(cluster, position, self._range_labels[slot].mapToGlobal(pos))
 
     def _display_grid(self):
         """Displays all clusters in a compact grid"""
-        # Create grid layout inside a widget
-        grid_widget = QWidget()
-        grid_layout = QGridLayout()
-        grid_layout.setSpacing(2)
-        grid_layout.setContentsMargins(5, 5, 5, 5)
-
-        # Display clusters in grid (15 columns)
-        cols = 15
-        for i, cluster in enumerate(self.chain):
-            row = i // cols
-            col = i % cols
-
-            is_last = (i == len(self.chain) - 1)
-
-            cluster_btn = QPushButton(str(cluster))
-            cluster_btn.setFixedSize(50, 25)
-
-            # Different style for last cluster (EOF)
-            if is_last:
-                cluster_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #FFF3E0;
-                        border: 2px solid #FF9800;
-                        border-radius: 2px;
-                        font-size: 9pt;
-                        font-weight: bold;
-                    }
-                    QPushButton:hover {
-                        background-color: #FFE0B2;
-                    }
-                """)
-                cluster_btn.setToolTip(f"Cluster {cluster} [EOF - Last cluster]")
-            else:
-                cluster_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #E3F2FD;
-                        border: 1px solid #90CAF9;
-                        border-radius: 2px;
-                        font-size: 9pt;
-                    }
-                    QPushButton:hover {
-                        background-color: #BBDEFB;
-                    }
-                """)
-                cluster_btn.setToolTip(f"Cluster {cluster} - Right-click for options")
-
-            # Left click
-            cluster_btn.clicked.connect(lambda checked, c=cluster: self._on_cluster_clicked(c))
-
-            # Right click - context menu
-            cluster_btn.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-            cluster_btn.customContextMenuRequested.connect(
-                lambda pos, c=cluster, btn=cluster_btn: self._show_grid_context_menu(c, btn.mapToGlobal(pos))
-            )
-
-            grid_layout.addWidget(cluster_btn, row, col)
-
-        grid_widget.setLayout(grid_layout)
-        self.chain_layout.addWidget(grid_widget)
+        # Display clusters in grid (15 columns) - painted by a single widget
+        self.chain_grid.set_chain(self.chain)
+        self.chain_layout.addWidget(self.chain_grid)
+        self.chain_grid.show()
         self.chain_layout.addStretch()
 
-    def _show_grid_context_menu(self, cluster_number: int, global_pos):
-        """Shows context menu for grid mode clusters"""
-        # Delegate to the same handler as full mode
-        self._on_cluster_right_clicked(cluster_number, global_pos)
-
     def _display_full(self):
         """Displays chain with individual cluster blocks (ALL clusters)"""
-        # Display ALL clusters - no limit
-        for i, cluster in enumerate(self.chain):
-            is_last = (i == len(self.chain) - 1)
-
-            block = ClusterBlock(cluster, i, is_last)
-            block.clicked.connect(self._on_cluster_clicked)
-            block.right_clicked.connect(self._on_cluster_right_clicked)
-
-            self.cluster_blocks.append(block)
-            self.chain_layout.addWidget(block)
-
-            # Add arrow between clusters (except after the last one)
-            if i < len(self.chain) - 1:
-                arrow = QLabel("→")
-                arrow.setStyleSheet("font-size: 20pt; color: #495057; padding: 0 5px;")
-                self.chain_layout.addWidget(arrow)
-
+        # Display ALL clusters - painted by a single widget
+        self.chain_view.set_chain(self.chain)
+        self.chain_layout.addWidget(self.chain_view)
+        self.chain_view.show()
         self.chain_layout.addStretch()
 
-        # Add a warning if the chain is very long
-        if len(self.chain) > 100:
-            warning = QLabel(f"⚠️ Large chain ({len(self.chain)} clusters) - Consider using Grid or Compact view for better performance")
-            warning.setStyleSheet("color: #FF9800; font-style: italic; padding: 5px; background-color: #FFF3E0; border-radius: 3px;")
-            warning.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.chain_layout.insertWidget(0, warning)
-
-    def _create_fragmentation_bar(self, fragmentation):
-        """Creates a visual fragmentation progress bar"""
-        bar = QLabel()
-        bar.setFixedHeight(20)
-        bar.setStyleSheet("background-color: #E0E0E0; border-radius: 3px; border: 1px solid #BDBDBD;")
+    def _update_fragmentation_bar(self, fragmentation):
+        """Updates the visual fragmentation progress bar"""
+        bar = self._frag_bar
 
         # Calculate bar color based on fragmentation
         if fragmentation < 20:
@@ -492,9 +920,9 @@ class FATChainEditor(QWidget):
 
         bar_text = f"Fragmentation: {fragmentation:.1f}% " + text
         bar.setText(bar_text)
-        bar.setStyleSheet(f"background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 {color}, stop:{(100-fragmentation)/100} {color}, stop:{(100-fragmentation)/100} #E0E0E0, stop:1 #E0E0E0); color: #000; font-weight: bold; padding-left: 10px; border-radius: 3px; border: 1px solid #BDBDBD;")
-
-        return bar
+        style = _fragmentation_style(color, round(100 - fragmentation))
+        if bar.styleSheet() != style:
+            bar.setStyleSheet(style)
 
     def _on_cluster_clicked(self, cluster_number: int):
         """Callback when a cluster is clicked"""
@@ -502,74 +930,111 @@ class FATChainEditor(QWidget):
         if self.on_cluster_click:
             self.on_cluster_click(cluster_number)
 
-    def _on_cluster_right_clicked(self, cluster_number: int, pos: QPoint):
-        """Callback when a cluster is right-clicked"""
-        menu = QMenu(self)
-
-        # Find the cluster's position in the chain
-        try:
-            cluster_position = self.chain.index(cluster_number)
-        except ValueError:
-            cluster_position = -1
-
-        # Action to view content
-        view_action = QAction(f"👁️ View cluster {cluster_number} content", self)
-        view_action.triggered.connect(lambda: self._on_cluster_clicked(cluster_number))
-        menu.addAction(view_action)
-
-        menu.addSeparator()
-
-        # Action to mark as EOF (last)
-        if cluster_position >= 0:
-            mark_eof_action = QAction(f"🔚 Mark as last (EOF)", self)
-            mark_eof_action.triggered.connect(lambda: self._mark_as_eof(cluster_position))
-            menu.addAction(mark_eof_action)
-
-        menu.addSeparator()
-
-        # Action to remove cluster
-        remove_action = QAction(f"🗑️ Remove cluster {cluster_number}", self)
-        remove_action.triggered.connect(lambda: self._remove_cluster_by_value(cluster_number))
-        menu.addAction(remove_action)
-
-        menu.exec(pos)
+    def _on_cluster_right_clicked(self, cluster_number: int, position: int, pos: QPoint):
+        """Callback when a cluster is right-clicked (position is its index in the chain)"""
+        self._ctx_cluster = cluster_number
+        self._ctx_position = position
+        self._view_action.setText(f"👁️ View cluster {cluster_number} content")
+        self._remove_action.setText(f"🗑️ Remove cluster {cluster_number}")
+        self._ctx_menu.exec(pos)
+
+    def _on_context_action(self, action: QAction):
+        """Dispatches a context menu action on the right-clicked cluster"""
+        if action is self._view_action:
+            self._on_cluster_clicked(self._ctx_cluster)
+        elif action is self._eof_action:
+            self._mark_as_eof(self._ctx_position)
+        elif action is self._remove_action:
+            self.remove_cluster_at(self._ctx_position)
+
+    def _chain_edited(self):
+        """Drops results derived from the chain and schedules the refresh"""
+        self._ranges_cache = None
+        self._emit_pending = True
+        self.refresh_display()
 
-    def _remove_cluster_by_value(self, cluster_number: int):
-        """Removes the first occurrence of a cluster from the chain"""
-        try:
-            # Find the position
-            position = self.chain.index(cluster_number)
-            self.remove_cluster_at(position)
-        except ValueError:
-            pass
-
-    def _mark_as_eof(self, position: int):
-        """Marks a cluster as EOF (last in the chain)"""
+    def _view_in_sync(self, displayed_len: int) -> Optional[FATChainView]:
+        """Returns the grid/full view if it shows exactly displayed_len clusters and no rebuild is pending"""
+        if self._display_dirty or self._displayed_len != displayed_len:
+            return None  # Compact mode, empty chain or a rebuild already scheduled
+        return self.chain_grid if self.display_mode == "grid" else self.chain_view
+
+    def _edited_in_place(self):
+        """Completes an edit already applied to the displayed view (no rebuild)"""
+        self._displayed_len = len(self.chain)
+        self._update_info()
+
+        # chain_modified stays coalesced with other edits of the same frame
+        self._emit_pending = True
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _ensure_owned(self):
+        """Copies the caller's chain into our own array before the first edit"""
+        if not self._chain_owned:
+            self.chain = array('I', self.chain)
+            self._chain_owned = True
+
+    def _notify(self, title: str, text: str):
+        """Shows a success message without blocking the event loop"""
+        box = QMessageBox(QMessageBox.Icon.Information, title, text,
+                          QMessageBox.StandardButton.Ok, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.setWindowModality(Qt.WindowModality.NonModal)
+        box.show()
+
+    def _mark_as_eof(self, position: int, silent: bool = False):
+        """Marks a cluster as EOF (last in the chain), silent skips the message"""
         if 0 <= position < len(self.chain):
             # Truncate the chain at this position (keep up to and including position)
-            self.chain = self.chain[:position + 1]
-            self.refresh_display()
-            self.chain_modified.emit(self.chain)
+            self._ensure_owned()
+            view = self._view_in_sync(len(self.chain))
+            del self.chain[position + 1:]
+            if view is None:
+                self._chain_edited()
+            else:
+                self._ranges_cache = None
+                view.truncate(position + 1)
+                self._edited_in_place()
 
-            QMessageBox.information(
-                self,
-                "Marked as EOF",
-                f"Cluster {self.chain[position]} is now the last in the chain.\n"
-                f"All following clusters have been removed."
-            )
+            if not silent:
+                self._notify(
+                    "Marked as EOF",
+                    f"Cluster {self.chain[position]} is now the last in the chain.\n"
+                    f"All following clusters have been removed."
+                )
 
     def add_cluster(self, cluster_number: int):
         """Adds a cluster to the end of the chain"""
+        self._ensure_owned()
+        # Grid and full displays already showing the rest of the chain only get the new block
+        view = self._view_in_sync(len(self.chain))
         self.chain.append(cluster_number)
-        self.refresh_display()
-        self.chain_modified.emit(self.chain)
+        if view is None:
+            self._chain_edited()
+            return
+
+        self._extend_ranges(cluster_number)
+        view.append_cluster(cluster_number)
+        self._edited_in_place()
+
+    def _extend_ranges(self, cluster_number: int):
+        """Updates the cached ranges for a cluster appended to the chain"""
+        ranges = self._ranges_cache
+        if not ranges:
+            self._ranges_cache = None  # Recomputed on demand
+            return
+        start, end, count, _ = ranges[-1]
+        if cluster_number == end + 1:
+            ranges[-1] = (start, cluster_number, count + 1, True)
+        else:
+            ranges[-1] = (start, end, count, True)  # No longer the last range
+            ranges.append((cluster_number, cluster_number, 1, False))
 
     # Method add_eof() removed - use _mark_as_eof() instead via right-click
 
     def show_add_cluster_dialog(self):
         """Shows a dialog to add a cluster"""
-        from PyQt6.QtWidgets import QInputDialog
-
         cluster_number, ok = QInputDialog.getInt(
             self,
             "Add Cluster",
@@ -592,19 +1057,25 @@ class FATChainEditor(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            self.chain.clear()
-            self.refresh_display()
-            self.chain_modified.emit(self.chain)
+            self._ensure_owned()
+            del self.chain[:]
+            self._chain_edited()
 
-    def remove_cluster_at(self, index: int):
-        """Removes a cluster at the given index"""
+    def remove_cluster_at(self, index: int, silent: bool = False):
+        """Removes a cluster at the given index, silent skips the message (bulk edits)"""
         if 0 <= index < len(self.chain):
+            self._ensure_owned()
+            view = self._view_in_sync(len(self.chain))
             removed = self.chain.pop(index)
-            self.refresh_display()
-            self.chain_modified.emit(self.chain)
-            QMessageBox.information(
-                self,
-                "Cluster Removed",
-                f"Cluster {removed} has been removed from position {index}"
-            )
+            if view is None or not self.chain:
+                self._chain_edited()  # The empty chain has its own display
+            else:
+                self._ranges_cache = None
+                view.remove_at(index)
+                self._edited_in_place()
+            if not silent:
+                self._notify(
+                    "Cluster Removed",
+                    f"Cluster {removed} has been removed from position {index}"
+                )
 
@@ -6,14 +6,14 @@ Permet d'ouvrir une image .raw FAT16 et de visualiser/éditer la structure
 import sys
 import struct
 from typing import Optional
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
-                              QHBoxLayout, QPushButton, QFileDialog, QLabel,
-                              QSplitter, QGroupBox, QScrollArea, QTextEdit,
-                              QSpinBox, QComboBox, QMessageBox, QTabWidget,
-                              QFrame, QLineEdit, QListWidget, QListWidgetItem, QCheckBox,
-                              QProgressDialog)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QAction, QPainter, QColor, QPen, QPixmap
+from qt_compat import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+                        QHBoxLayout, QPushButton, QFileDialog, QLabel,
+                        QSplitter, QGroupBox, QScrollArea, QTextEdit,
+                        QSpinBox, QComboBox, QMessageBox, QTabWidget,
+                        QFrame, QLineEdit, QListWidget, QListWidgetItem, QCheckBox,
+                        QProgressDialog)
+from qt_compat import Qt, QThread, pyqtSignal
+from qt_compat import QAction, QPainter, QColor, QPen, QPixmap
 
 from fat16_parser import FAT16Parser, MBRPartition
 from hex_viewer import HexViewer
@@ -71,22 +71,29 @@ class PartitionMapWidget(QWidget):
         scanned_count = 0
         empty_count = 0
 
-        for sector_num in range(first_data_sector, total_sectors):
-            try:
-                # Lire le secteur
-                sector_data = self.parser.read_sector(sector_num)
+        try:
+            # Lire toute la zone scannée en une fois (les secteurs sont contigus)
+            data = self.parser.read_sectors(first_data_sector, max(0, total_sectors - first_data_sector))
+        except Exception as e:
+            print(f"[PartitionMap] Error reading sectors {first_data_sector}-{total_sectors}: {e}")
+            return
+
+        # Découper en secteurs sans copie (memoryview) et comparer à un secteur vide
+        # en C, au lieu de tester chaque octet en Python
+        bytes_per_sector = bs.bytes_per_sector
+        zero_sector = bytes(bytes_per_sector)
+        view = memoryview(data)
 
-                # Vérifier si tous les octets sont à 0x00
-                if all(b == 0x00 for b in sector_data):
-                    self.empty_sectors.add(sector_num)
-                    empty_count += 1
+        for index, sector_num in enumerate(range(first_data_sector, total_sectors)):
+            offset = index * bytes_per_sector
+            sector_data = view[offset:offset + bytes_per_sector]
 
-                scanned_count += 1
+            # Vérifier si tous les octets sont à 0x00 (un secteur au-delà de la fin de l'image est vide)
+            if sector_data == zero_sector[:len(sector_data)]:
+                self.empty_sectors.add(sector_num)
+                empty_count += 1
 
-            except Exception as e:
-                # En cas d'erreur, ignorer ce secteur
-                print(f"[PartitionMap] Error reading sector {sector_num}: {e}")
-                continue
+            scanned_count += 1
 
         elapsed = (__import__('time').time() - start_time) * 1000  # en ms
         print(f"[PartitionMap] Scan complete: {scanned_count} sectors scanned, {empty_count} empty sectors found in {elapsed:.1f} ms")
@@ -396,18 +403,23 @@ class SearchWorker(QThread):
                     print(f"Erreur lors de la recherche dans le Root Directory: {e}")
 
             # 2. Parcourir tous les clusters
+            # (méthodes et attributs constants liés une fois pour toute la boucle)
             total_clusters = bs.total_clusters
+            read_cluster = self.parser.read_cluster
+            emit_progress = self.progress_update.emit
+            case_sensitive = self.case_sensitive
             for cluster_num in range(2, total_clusters + 2):
                 if self.cancelled or self.results_count >= self.max_results:
                     break
 
                 # Émettre la progression tous les 50 clusters
                 if (cluster_num - 2) % 50 == 0:
-                    self.progress_update.emit(cluster_num - 2, total_clusters)
+                    emit_progress(cluster_num - 2, total_clusters)
 
                 try:
-                    cluster_data = self.parser.read_cluster(cluster_num)
-                    search_data = cluster_data if self.case_sensitive else cluster_data.lower()
+                    cluster_data = read_cluster(cluster_num)
+                    search_data = cluster_data if case_sensitive else cluster_data.lower()
+                    cluster_start = data_start_offset + (cluster_num - 2) * cluster_size
 
                     offset = 0
                     while True:
@@ -415,8 +427,7 @@ class SearchWorker(QThread):
                         if pos == -1:
                             break
 
-                        cluster_offset = (cluster_num - 2) * cluster_size
-                        absolute_offset = data_start_offset + cluster_offset + pos
+                        absolute_offset = cluster_start + pos
 
                         context_start = max(0, pos - 20)
                         context_end = min(len(cluster_data), pos + len(search_bytes) + 20)
@@ -848,8 +859,7 @@ class FATSimulatorGUI(QMainWindow):
 
             # Lire le contenu du cluster
             data = self.parser.read_cluster(cluster_number)
-            offset = bs.first_data_sector * bs.bytes_per_sector
-            offset += (cluster_number - 2) * bs.sectors_per_cluster * bs.bytes_per_sector
+            offset = self.parser.get_cluster_offset(cluster_number)
 
             # Afficher dans le hex viewer de la chaîne (sans highlights)
             self.chain_hex_viewer.highlight_ranges = []  # Effacer les highlights avant d'afficher
@@ -858,7 +868,7 @@ class FATSimulatorGUI(QMainWindow):
 
             # Calculer les secteurs pour la mise en évidence
             # 1. Secteur de l'entrée FAT (dans FAT1)
-            fat_entry_offset = bs.reserved_sectors * bs.bytes_per_sector + (cluster_number * 2)
+            fat_entry_offset = self.parser.get_fat_entry_offset(cluster_number)
             fat_sector = fat_entry_offset // bs.bytes_per_sector
 
             # 2. Secteur du cluster de données
@@ -938,12 +948,11 @@ class FATSimulatorGUI(QMainWindow):
 
             # 1. Charger la chaîne FAT
             chain = self.parser.parse_fat_chain(self.fat_data, cluster_number)
-            self.chain_editor.set_chain(chain)
+            self.chain_editor.set_chain(chain, copy=False)  # Fresh list, not kept
 
             # 2. Calculer les offsets
-            fat_entry_offset = bs.reserved_sectors * bs.bytes_per_sector + (cluster_number * 2)
-            data_offset = bs.first_data_sector * bs.bytes_per_sector
-            data_offset += (cluster_number - 2) * bs.sectors_per_cluster * bs.bytes_per_sector
+            fat_entry_offset = self.parser.get_fat_entry_offset(cluster_number)
+            data_offset = self.parser.get_cluster_offset(cluster_number)
 
             # Calculer les secteurs
             fat_sector = fat_entry_offset // bs.bytes_per_sector
@@ -1157,15 +1166,15 @@ class FATSimulatorGUI(QMainWindow):
                 # Ensuite, parser toute la chaîne depuis le début
                 t1b = time.time()
                 chain = self.parser.parse_fat_chain(self.fat_data, chain_start)
-                self.chain_editor.set_chain(chain)
-                print(f"[PERF]   parse_fat_chain + set_chain: {(time.time()-t1b)*1000:.1f}ms (total chain: {len(chain)} clusters)")
+                self.chain_editor.set_chain(chain, copy=False)  # Fresh list, not kept
+                print(f"[PERF]   parse_fat_chain + set_chain (display rebuild scheduled): {(time.time()-t1b)*1000:.1f}ms (total chain: {len(chain)} clusters)")
 
                 # 2. Lire et afficher le contenu du cluster dans le hex viewer
                 t2 = time.time()
                 cluster_data = self.parser.read_cluster(cluster_num)
                 print(f"[PERF]   read_cluster: {(time.time()-t2)*1000:.1f}ms")
 
-                cluster_offset = bs.first_data_sector * bs.bytes_per_sector + (cluster_num - 2) * bs.sectors_per_cluster * bs.bytes_per_sector
+                cluster_offset = self.parser.get_cluster_offset(cluster_num)
 
                 t3 = time.time()
                 self.chain_hex_viewer.set_title(f"Cluster {cluster_num} (Offset: 0x{cluster_offset:X}) - Résultat de recherche")
@@ -1184,7 +1193,7 @@ class FATSimulatorGUI(QMainWindow):
                     print(f"[PERF]   highlight_range: {(time.time()-t5)*1000:.1f}ms")
 
                 # 3. Calculer les secteurs pour la mise en évidence
-                fat_entry_offset = bs.reserved_sectors * bs.bytes_per_sector + (cluster_num * 2)
+                fat_entry_offset = self.parser.get_fat_entry_offset(cluster_num)
                 fat_sector = fat_entry_offset // bs.bytes_per_sector
                 data_sector = bs.first_data_sector + (cluster_num - 2) * bs.sectors_per_cluster
 
@@ -3,13 +3,16 @@ Widget pour visualiser la table FAT complète avec tous les indices/clusters
 """
 
 from typing import Optional, Callable
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                              QScrollArea, QGridLayout, QLineEdit, QPushButton,
-                              QFrame, QSizePolicy)
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData, QSize
-from PyQt6.QtGui import QDrag, QPainter, QColor, QPen, QFont
+from qt_compat import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                        QScrollArea, QGridLayout, QLineEdit, QPushButton,
+                        QFrame, QSizePolicy)
+from qt_compat import Qt, pyqtSignal, QMimeData, QSize, mouse_pos
+from qt_compat import QDrag, QPainter, QColor, QPen, QFont
 import struct
 
+# Lecture d'une entrée FAT16 (2 octets little-endian) sans copie ni reparsing du format
+_U16 = struct.Struct('<H').unpack_from
+
 
 class ClusterCell(QLabel):
     """Widget représentant un cluster dans la table FAT (draggable)"""
@@ -109,7 +112,7 @@ class ClusterCell(QLabel):
                 # Créer une pixmap pour le drag
                 pixmap = self.grab()
                 drag.setPixmap(pixmap)
-                drag.setHotSpot(event.position().toPoint())
+                drag.setHotSpot(mouse_pos(event))
 
                 # Exécuter le drag
                 drag.exec(Qt.DropAction.CopyAction)
@@ -233,7 +236,7 @@ class FATTableViewer(QWidget):
         for i in range(max_display):
             offset = i * 2
             if offset + 2 <= len(fat_data):
-                next_cluster = struct.unpack('<H', fat_data[offset:offset + 2])[0]
+                next_cluster = _U16(fat_data, offset)[0]
 
                 cell = ClusterCell(i, next_cluster)
                 cell.clicked.connect(self._on_cluster_clicked)
@@ -302,7 +305,7 @@ class FATTableViewer(QWidget):
 
         offset = cluster_index * 2
         if offset + 2 <= len(self.fat_data):
-            return struct.unpack('<H', self.fat_data[offset:offset + 2])[0]
+            return _U16(self.fat_data, offset)[0]
         return None
 
     def clear(self):
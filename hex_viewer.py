@@ -2,10 +2,10 @@
 Widget personnalisé pour afficher des données en hexadécimal
 """
 
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTextEdit, QLabel,
-                              QHBoxLayout, QCheckBox, QMessageBox)
-from PyQt6.QtGui import QFont, QTextCursor, QTextCharFormat, QColor, QKeyEvent
-from PyQt6.QtCore import Qt, pyqtSignal, QObject, QEvent
+from qt_compat import (QWidget, QVBoxLayout, QTextEdit, QLabel,
+                        QHBoxLayout, QCheckBox, QMessageBox)
+from qt_compat import QFont, QTextCursor, QTextCharFormat, QColor, QKeyEvent
+from qt_compat import Qt, pyqtSignal, QObject, QEvent
 
 
 class HexEditEventFilter(QObject):
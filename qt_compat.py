@@ -0,0 +1,26 @@
+"""
+Qt binding selection for the GUI modules
+
+PyQt5 is used when it is installed (its per-call binding overhead is lower,
+which shows on widget-heavy views like the chain editor), PyQt6 otherwise.
+Every GUI module imports its Qt names from here: both bindings cannot be
+mixed in one process.
+"""
+
+try:
+    from PyQt5.QtCore import *  # noqa: F401,F403
+    from PyQt5.QtGui import *  # noqa: F401,F403
+    from PyQt5.QtWidgets import *  # noqa: F401,F403
+    QT_API = "PyQt5"
+except ImportError:
+    from PyQt6.QtCore import *  # noqa: F401,F403
+    from PyQt6.QtGui import *  # noqa: F401,F403
+    from PyQt6.QtWidgets import *  # noqa: F401,F403
+    QT_API = "PyQt6"
+
+
+def mouse_pos(event) -> "QPoint":
+    """Returns the local position of a mouse event as a QPoint (Qt5 has no position())"""
+    if QT_API == "PyQt5":
+        return event.pos()
+    return event.position().toPoint()